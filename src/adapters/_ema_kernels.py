@@ -0,0 +1,168 @@
+"""
+Numeric kernels for RealTimeMarketDataFetcher EMA tracking and regime
+classification.
+
+Kernels take and return plain floats and int regime codes so they can be
+JIT-compiled with Numba when it is installed. The replay kernel advances
+the EMAs over a whole price history in one compiled sequential loop when
+Numba is available; otherwise the recurrence is a Python loop and the
+classification uses NumPy array comparisons.
+"""
+import math
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Regime codes; RealTimeMarketDataFetcher maps them back to MarketRegime
+REGIME_RANGING = 0
+REGIME_TRENDING_UP = 1
+REGIME_TRENDING_DOWN = 2
+
+# Fast EMA must be this far above/below the slow EMA to count as trending
+_TREND_BAND = 0.02
+
+
+def _classify_regime(ema_fast: float, ema_slow: float) -> int:
+    """
+    Classify the market regime from a fast/slow EMA pair.
+
+    Args:
+        ema_fast: Fast EMA
+        ema_slow: Slow EMA
+
+    Returns:
+        REGIME_TRENDING_UP/REGIME_TRENDING_DOWN beyond a 2% band,
+        otherwise REGIME_RANGING
+    """
+    if ema_fast > ema_slow * (1.0 + _TREND_BAND):
+        return REGIME_TRENDING_UP
+    if ema_fast < ema_slow * (1.0 - _TREND_BAND):
+        return REGIME_TRENDING_DOWN
+    return REGIME_RANGING
+
+
+def _update_ema_regime(
+    price: float,
+    ema_fast: float,
+    ema_slow: float,
+    fast_alpha: float,
+    slow_alpha: float
+) -> Tuple[float, float, int]:
+    """
+    Advance fast/slow EMAs by one price and classify the market regime.
+
+    Args:
+        price: Latest price
+        ema_fast: Previous fast EMA (NaN to seed from price)
+        ema_slow: Previous slow EMA (NaN to seed from price)
+        fast_alpha: Fast EMA smoothing factor
+        slow_alpha: Slow EMA smoothing factor
+
+    Returns:
+        Tuple of (ema_fast, ema_slow, regime_code)
+    """
+    if math.isnan(ema_fast) or math.isnan(ema_slow):
+        ema_fast = price
+        ema_slow = price
+    else:
+        ema_fast = fast_alpha * price + (1.0 - fast_alpha) * ema_fast
+        ema_slow = slow_alpha * price + (1.0 - slow_alpha) * ema_slow
+
+    return ema_fast, ema_slow, classify_regime(ema_fast, ema_slow)
+
+
+def _update_ema_regime_loop(
+    prices: np.ndarray,
+    ema_fast: float,
+    ema_slow: float,
+    fast_alpha: float,
+    slow_alpha: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Replay a price history through the EMAs and classify every step.
+
+    Args:
+        prices: Prices in time order
+        ema_fast: Fast EMA before the first price (NaN to seed from it)
+        ema_slow: Slow EMA before the first price (NaN to seed from it)
+        fast_alpha: Fast EMA smoothing factor
+        slow_alpha: Slow EMA smoothing factor
+
+    Returns:
+        Tuple of (ema_fast, ema_slow, regime_code) arrays, one entry per price
+    """
+    n = prices.shape[0]
+    fast = np.empty(n, dtype=np.float64)
+    slow = np.empty(n, dtype=np.float64)
+    codes = np.empty(n, dtype=np.int8)
+
+    # The recurrence depends on the previous step, so it stays sequential
+    for i in range(n):
+        ema_fast, ema_slow, codes[i] = update_ema_regime(
+            prices[i], ema_fast, ema_slow, fast_alpha, slow_alpha
+        )
+        fast[i] = ema_fast
+        slow[i] = ema_slow
+    return fast, slow, codes
+
+
+def _update_ema_regime_py(
+    prices: np.ndarray,
+    ema_fast: float,
+    ema_slow: float,
+    fast_alpha: float,
+    slow_alpha: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Plain-Python replay for when Numba is unavailable.
+
+    The EMA recurrence runs as a Python loop over a list of floats; only
+    the regime classification is vectorized with NumPy.
+
+    Args:
+        prices: Prices in time order
+        ema_fast: Fast EMA before the first price (NaN to seed from it)
+        ema_slow: Slow EMA before the first price (NaN to seed from it)
+        fast_alpha: Fast EMA smoothing factor
+        slow_alpha: Slow EMA smoothing factor
+
+    Returns:
+        Tuple of (ema_fast, ema_slow, regime_code) arrays, one entry per price
+    """
+    fast_list = []
+    slow_list = []
+    fast_decay = 1.0 - fast_alpha
+    slow_decay = 1.0 - slow_alpha
+    for price in np.asarray(prices, dtype=np.float64).tolist():
+        if math.isnan(ema_fast) or math.isnan(ema_slow):
+            ema_fast = price
+            ema_slow = price
+        else:
+            ema_fast = fast_alpha * price + fast_decay * ema_fast
+            ema_slow = slow_alpha * price + slow_decay * ema_slow
+        fast_list.append(ema_fast)
+        slow_list.append(ema_slow)
+
+    fast = np.array(fast_list, dtype=np.float64)
+    slow = np.array(slow_list, dtype=np.float64)
+    codes = np.full(fast.shape[0], REGIME_RANGING, dtype=np.int8)
+    codes[fast > slow * (1.0 + _TREND_BAND)] = REGIME_TRENDING_UP
+    codes[fast < slow * (1.0 - _TREND_BAND)] = REGIME_TRENDING_DOWN
+    return fast, slow, codes
+
+
+if NUMBA_AVAILABLE:
+    classify_regime = njit(cache=True)(_classify_regime)
+    update_ema_regime = njit(cache=True)(_update_ema_regime)
+    update_ema_regime_vec = njit(cache=True)(_update_ema_regime_loop)
+    # Compile on import so the first fetch doesn't pay for it
+    update_ema_regime(100.0, math.nan, math.nan, 0.2, 0.067)
+else:
+    classify_regime = _classify_regime
+    update_ema_regime = _update_ema_regime
+    update_ema_regime_vec = _update_ema_regime_py
@@ -3,10 +3,18 @@ Jupiter Quote Client for real-time trade quotes.
 
 Implements QuoteClient protocol to fetch actual quotes from Jupiter aggregator.
 """
+import dataclasses
 import logging
-from typing import Dict, Any, Optional
+import random
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Union
 import aiohttp
+import orjson
 import asyncio
+from yarl import URL
+
+from src.core.types import Quote
 
 logger = logging.getLogger(__name__)
 
@@ -18,11 +26,20 @@ class JupiterQuoteClient:
     Fetches actual quotes with real slippage and fee data.
     """
     
+    # Base-unit scale factors (USDC has 6 decimals, SOL has 9)
+    _USDC_SCALE = 1e-6
+    _SOL_SCALE = 1e-9
+    _USDC_UNITS = 10**6
+    _SOL_UNITS = 10**9
+    _USDC_PER_SOL = 1e3  # _SOL_UNITS / _USDC_UNITS
+    
     def __init__(
         self,
         jupiter_endpoint: str = "https://quote-api.jup.ag/v6",
         timeout_sec: float = 5.0,
-        max_retries: int = 3
+        max_retries: int = 3,
+        quote_ttl_sec: float = 1.0,
+        quote_cache_size: int = 256
     ):
         """
         Initialize Jupiter quote client.
@@ -31,23 +48,97 @@ class JupiterQuoteClient:
             jupiter_endpoint: Jupiter API base URL
             timeout_sec: HTTP request timeout
             max_retries: Maximum retry attempts
+            quote_ttl_sec: How long a fetched quote may be reused
+            quote_cache_size: Maximum number of cached quotes (LRU)
         """
         self.jupiter_endpoint = jupiter_endpoint
         self.timeout_sec = timeout_sec
         self.max_retries = max_retries
+        self._backoff_cap = 4.0  # Max seconds between retries
+        self._quote_url = URL(f"{jupiter_endpoint}/quote")
         
         # Token addresses
         self.sol_mint = "So11111111111111111111111111111111111111112"
         self.usdc_mint = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
         
+        # Degraded-mode quote; size-dependent fields are filled in per call
+        self._fallback_quote_template = Quote(
+            price=100.0,  # Fallback price
+            slippage_pct=0.1,
+            fees_usd=0.0,
+            estimated_fill=0.0,
+            is_fallback=True
+        )
+        
+        # Long-lived HTTP session (created lazily, reused across quotes)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Short-lived quote cache: key -> (monotonic timestamp, quote)
+        self._quote_cache: "OrderedDict[tuple, Tuple[float, Quote]]" = OrderedDict()
+        self._quote_ttl_sec = quote_ttl_sec
+        self._quote_cache_size = quote_cache_size
+        
         logger.info(f"Initialized JupiterQuoteClient: {jupiter_endpoint}")
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use.
+        
+        Reusing one session keeps TCP/TLS connections alive between quotes.
+        
+        Returns:
+            Shared aiohttp session
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout_sec)
+            )
+        return self._session
+    
+    async def warmup(self):
+        """
+        Resolve DNS and open a keep-alive connection to Jupiter ahead of trading.
+        
+        Failures are logged and ignored; the first real quote will retry.
+        """
+        session = await self._get_session()
+        params = {
+            "inputMint": self.sol_mint,
+            "outputMint": self.usdc_mint,
+            "amount": str(self._SOL_UNITS),
+            "slippageBps": "50"
+        }
+        try:
+            async with session.get(self._quote_url, params=params) as response:
+                await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning("Jupiter warmup failed: %s", e)
+    
+    async def aclose(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def __aenter__(self) -> "JupiterQuoteClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
     async def get_quote(
         self,
         symbol: str,
         size_notional: float,
-        side: str
-    ) -> Dict[str, Any]:
+        side: str,
+        include_raw: bool = False
+    ) -> Quote:
         """
         Get a real-time quote from Jupiter.
         
@@ -55,27 +146,136 @@ class JupiterQuoteClient:
             symbol: Trading pair (e.g., "SOL/USD")
             size_notional: Size in USD
             side: "buy" or "sell"
+            include_raw: Keep the full Jupiter response and route plan
+            
+        Returns:
+            Quote with price, slippage, fees
+        """
+        session = await self._get_session()
+        return await self._single_quote(session, symbol, size_notional, side, include_raw)
+    
+    async def try_get_quote(
+        self,
+        symbol: str,
+        size_notional: float,
+        side: str
+    ) -> Tuple[bool, Union[Quote, str]]:
+        """
+        Get a quote from Jupiter, reporting failure as a value.
+        
+        Network errors already degrade to a fallback quote inside
+        _single_quote; anything else, such as a malformed response, or
+        no quote at all, is reported as a failure.
+        
+        Args:
+            symbol: Trading pair (e.g., "SOL/USD")
+            size_notional: Size in USD
+            side: "buy" or "sell"
+            
+        Returns:
+            (True, quote) on success, (False, error message) on failure
+        """
+        try:
+            quote = await self.get_quote(symbol, size_notional, side)
+        except Exception as e:
+            logger.warning("Quote failed for %s: %s", symbol, e)
+            return False, str(e)
+        if quote is None:
+            return False, "No quote returned"
+        return True, quote
+    
+    async def get_quotes(
+        self,
+        reqs: List[Tuple[str, float, str]],
+        include_raw: bool = False
+    ) -> List[Union[Quote, BaseException]]:
+        """
+        Get several quotes concurrently over the shared session.
+        
+        Args:
+            reqs: List of (symbol, size_notional, side) tuples
+            include_raw: Keep the full Jupiter responses and route plans
+            
+        Returns:
+            Quotes in request order; a failed request yields its exception
+        """
+        session = await self._get_session()
+        # Build every coroutine up front so all requests are in flight together
+        coros = [
+            self._single_quote(session, symbol, size_notional, side, include_raw)
+            for symbol, size_notional, side in reqs
+        ]
+        return await asyncio.gather(*coros, return_exceptions=True)
+    
+    async def get_quotes_batch(
+        self,
+        symbol: str,
+        sizes: List[float],
+        side: str
+    ) -> List[Union[Quote, BaseException]]:
+        """
+        Get quotes for several sizes of the same trade in one burst.
+        
+        Args:
+            symbol: Trading pair (e.g., "SOL/USD")
+            sizes: Sizes in USD
+            side: "buy" or "sell"
+            
+        Returns:
+            Quotes in size order; a failed request yields its exception
+        """
+        return await self.get_quotes([(symbol, size, side) for size in sizes])
+    
+    async def _single_quote(
+        self,
+        session: aiohttp.ClientSession,
+        symbol: str,
+        size_notional: float,
+        side: str,
+        include_raw: bool = False
+    ) -> Quote:
+        """
+        Fetch one quote from Jupiter using the given session.
+        
+        Args:
+            session: aiohttp session
+            symbol: Trading pair (e.g., "SOL/USD")
+            size_notional: Size in USD
+            side: "buy" or "sell"
+            include_raw: Keep the full Jupiter response and route plan;
+                otherwise route_plan is a tuple of AMM labels
             
         Returns:
-            Quote dictionary with price, slippage, fees
+            Quote with price, slippage, fees
         """
         # Convert USD size to token amount
         # For simplicity, we'll get a quote and derive the price
         
+        is_buy = side.lower() == "buy"
+        
         # Determine input/output mints based on side
-        if side.lower() == "buy":
+        if is_buy:
             input_mint = self.usdc_mint
             output_mint = self.sol_mint
             # Convert USD to USDC (6 decimals)
-            amount = int(size_notional * 10**6)
+            amount = int(size_notional * self._USDC_UNITS)
         else:  # sell
             input_mint = self.sol_mint
             output_mint = self.usdc_mint
             # TODO: Fetch current price for more accurate quote amount
             # For now, use rough estimate of $100/SOL
-            amount = int((size_notional / 100) * 10**9)  # Assume ~$100/SOL
+            amount = int((size_notional / 100) * self._SOL_UNITS)  # Assume ~$100/SOL
+        
+        # Serve repeated requests for the same size from the cache
+        cache_key = (input_mint, output_mint, round(size_notional, 2), is_buy, include_raw)
+        cached = self._quote_cache.get(cache_key)
+        if cached is not None:
+            cached_at, cached_quote = cached
+            if time.monotonic() - cached_at < self._quote_ttl_sec:
+                self._quote_cache.move_to_end(cache_key)
+                return cached_quote
+            del self._quote_cache[cache_key]
         
-        url = f"{self.jupiter_endpoint}/quote"
         params = {
             "inputMint": input_mint,
             "outputMint": output_mint,
@@ -83,70 +283,91 @@ class JupiterQuoteClient:
             "slippageBps": "50"  # 0.5% slippage tolerance
         }
         
-        async with aiohttp.ClientSession() as session:
-            for attempt in range(self.max_retries):
-                try:
-                    query = "&".join(f"{k}={v}" for k, v in params.items())
-                    full_url = f"{url}?{query}"
+        for attempt in range(self.max_retries):
+            try:
+                async with session.get(
+                    self._quote_url,
+                    params=params,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout_sec)
+                ) as response:
+                    response.raise_for_status()
+                    data = orjson.loads(await response.read())
                     
-                    async with session.get(
-                        full_url,
-                        timeout=aiohttp.ClientTimeout(total=self.timeout_sec)
-                    ) as response:
-                        response.raise_for_status()
-                        data = await response.json()
-                        
-                        # Extract quote data
-                        in_amount = int(data.get("inAmount", 0))
-                        out_amount = int(data.get("outAmount", 0))
-                        
-                        # Calculate price and slippage
-                        if side.lower() == "buy":
-                            # Buying SOL with USDC
-                            price = (in_amount / 10**6) / (out_amount / 10**9)
-                            sol_received = out_amount / 10**9
-                        else:
-                            # Selling SOL for USDC
-                            price = (out_amount / 10**6) / (in_amount / 10**9)
-                            sol_received = 0
-                        
-                        # Extract price impact (slippage)
-                        price_impact = float(data.get("priceImpactPct", 0))
-                        slippage_pct = abs(price_impact)
-                        
-                        # Estimate fees (Jupiter typically 0-0.05%)
-                        fees_usd = size_notional * 0.0005  # 0.05% estimate
-                        
-                        logger.debug(
-                            f"Jupiter quote: {side} ${size_notional:.2f} at ${price:.2f}, "
-                            f"slippage={slippage_pct:.4f}%, fees=${fees_usd:.4f}"
-                        )
-                        
-                        return {
-                            "price": price,
-                            "slippage_pct": slippage_pct,
-                            "fees_usd": fees_usd,
-                            "estimated_fill": sol_received if side.lower() == "buy" else size_notional / price,
-                            "route_plan": data.get("routePlan", []),
-                            "raw_quote": data
-                        }
-                        
-                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                    wait_time = 2 ** attempt
-                    logger.warning(
-                        f"Quote request failed (attempt {attempt + 1}/{self.max_retries}): {e}"
+                    # Extract quote data
+                    in_amount = int(data.get("inAmount", 0))
+                    out_amount = int(data.get("outAmount", 0))
+                    
+                    # Calculate price and slippage
+                    if is_buy:
+                        # Buying SOL with USDC
+                        price = (in_amount / out_amount) * self._USDC_PER_SOL
+                        sol_received = out_amount * self._SOL_SCALE
+                    else:
+                        # Selling SOL for USDC
+                        price = (out_amount / in_amount) * self._USDC_PER_SOL
+                        sol_received = 0
+                    
+                    # Extract price impact (slippage)
+                    price_impact = float(data.get("priceImpactPct", 0))
+                    slippage_pct = abs(price_impact)
+                    
+                    # Estimate fees (Jupiter typically 0-0.05%)
+                    fees_usd = size_notional * 0.0005  # 0.05% estimate
+                    
+                    logger.debug(
+                        "Jupiter quote: %s $%.2f at $%.2f, slippage=%.4f%%, fees=$%.4f",
+                        side, size_notional, price, slippage_pct, fees_usd
                     )
-                    if attempt < self.max_retries - 1:
-                        await asyncio.sleep(wait_time)
+                    
+                    route = data.get("routePlan", ())
+                    if include_raw:
+                        route_plan = tuple(route)
+                        raw_quote = data
                     else:
-                        logger.error("All quote attempts failed, using fallback")
-                        # Return fallback quote
-                        return {
-                            "price": 100.0,  # Fallback price
-                            "slippage_pct": 0.1,
-                            "fees_usd": size_notional * 0.001,
-                            "estimated_fill": size_notional / 100.0,
-                            "route_plan": [],
-                            "raw_quote": {},
-                            "is_fallback": True
-                        }
+                        # Keep only hop labels rather than the full nested route
+                        route_plan = tuple(
+                            hop.get("swapInfo", {}).get("label", "") for hop in route
+                        )
+                        raw_quote = None
+                    
+                    quote = Quote(
+                        price=price,
+                        slippage_pct=slippage_pct,
+                        fees_usd=fees_usd,
+                        estimated_fill=sol_received if is_buy else size_notional / price,
+                        route_plan=route_plan,
+                        raw_quote=raw_quote
+                    )
+                    self._cache_quote(cache_key, quote)
+                    return quote
+                    
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Jittered, capped exponential backoff so concurrent quotes don't retry in lockstep
+                wait_time = min(self._backoff_cap, random.uniform(0.1, (2 ** attempt) * 0.5))
+                logger.warning(
+                    f"Quote request failed (attempt {attempt + 1}/{self.max_retries}): {e}"
+                )
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.error("All quote attempts failed, using fallback")
+                    # Return fallback quote
+                    return dataclasses.replace(
+                        self._fallback_quote_template,
+                        fees_usd=size_notional * 0.001,
+                        estimated_fill=size_notional / 100.0,
+                        raw_quote={} if include_raw else None
+                    )
+    
+    def _cache_quote(self, key: tuple, quote: Quote):
+        """
+        Store a quote in the LRU cache, evicting the oldest entry when full.
+        
+        Args:
+            key: Cache key (input mint, output mint, size bucket, is_buy, include_raw)
+            quote: Quote to cache
+        """
+        self._quote_cache[key] = (time.monotonic(), quote)
+        self._quote_cache.move_to_end(key)
+        while len(self._quote_cache) > self._quote_cache_size:
+            self._quote_cache.popitem(last=False)
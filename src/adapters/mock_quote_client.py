@@ -3,8 +3,52 @@ MockQuoteClient: Mock Jupiter-like quote client for testing.
 
 Provides simulated quotes without requiring real API access.
 """
-import random
-from typing import Dict, Any
+from typing import Any, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.core.types import Quote
+
+
+class _SampleBuffer:
+    """
+    Pre-generated block of random samples drawn with NumPy.
+    
+    Draws samples in bulk and hands them out one at a time, refilling
+    when exhausted, so hot loops avoid a Python-level RNG call per sample.
+    """
+    
+    def __init__(self, seed: Optional[int] = None, size: int = 1 << 16):
+        self.rng = np.random.default_rng(seed)
+        self._size = size
+        self._refill()
+    
+    def _refill(self):
+        self._uniform = self.rng.random(self._size).tolist()
+        self._normal = self.rng.standard_normal(self._size).tolist()
+        self._ui = 0
+        self._ni = 0
+    
+    def uniform(self, low: float, high: float) -> float:
+        """Draw one sample from U(low, high)."""
+        if self._ui >= self._size:
+            self._refill()
+        u = self._uniform[self._ui]
+        self._ui += 1
+        return low + (high - low) * u
+    
+    def gauss(self, mu: float, sigma: float) -> float:
+        """Draw one sample from N(mu, sigma)."""
+        if self._ni >= self._size:
+            self._refill()
+        z = self._normal[self._ni]
+        self._ni += 1
+        return mu + sigma * z
+    
+    def choice(self, seq):
+        """Pick one element of a non-empty sequence uniformly."""
+        n = len(seq)
+        return seq[min(int(self.uniform(0, n)), n - 1)]
 
 
 class MockQuoteClient:
@@ -18,7 +62,8 @@ class MockQuoteClient:
         self,
         base_price: float = 100.0,
         base_slippage_pct: float = 0.05,
-        base_fee_pct: float = 0.05
+        base_fee_pct: float = 0.05,
+        seed: Optional[int] = None
     ):
         """
         Initialize mock quote client.
@@ -27,17 +72,19 @@ class MockQuoteClient:
             base_price: Base price for quotes
             base_slippage_pct: Base slippage percentage
             base_fee_pct: Base fee percentage
+            seed: Optional RNG seed for reproducible quotes
         """
         self.base_price = base_price
         self.base_slippage_pct = base_slippage_pct
         self.base_fee_pct = base_fee_pct
+        self._samples = _SampleBuffer(seed)
     
     async def get_quote(
         self,
         symbol: str,
         size_notional: float,
         side: str
-    ) -> Dict[str, Any]:
+    ) -> Quote:
         """
         Get a simulated quote.
         
@@ -47,14 +94,14 @@ class MockQuoteClient:
             side: "buy" or "sell"
             
         Returns:
-            Quote dictionary
+            Simulated Quote
         """
         # Add some price variance
-        price = self.base_price * random.uniform(0.995, 1.005)
+        price = self.base_price * self._samples.uniform(0.995, 1.005)
         
         # Slippage increases with size
         size_factor = min(size_notional / 1000.0, 2.0)
-        slippage_pct = self.base_slippage_pct * size_factor * random.uniform(0.8, 1.2)
+        slippage_pct = self.base_slippage_pct * size_factor * self._samples.uniform(0.8, 1.2)
         
         # Apply slippage
         if side.lower() == "buy":
@@ -65,16 +112,51 @@ class MockQuoteClient:
         # Calculate fees
         fees = size_notional * (self.base_fee_pct / 100)
         
-        return {
-            "symbol": symbol,
-            "side": side,
-            "size_notional": size_notional,
-            "price": quoted_price,
-            "slippage_pct": slippage_pct,
-            "fees": fees,
-            "route": ["mock_route_1", "mock_route_2"],
-            "estimated_execution_time_ms": random.uniform(100, 300)
-        }
+        return Quote(
+            price=quoted_price,
+            slippage_pct=slippage_pct,
+            fees_usd=fees,
+            estimated_fill=size_notional / quoted_price,
+            route_plan=("mock_route_1", "mock_route_2")
+        )
+    
+    async def try_get_quote(
+        self,
+        symbol: str,
+        size_notional: float,
+        side: str
+    ) -> Tuple[bool, Union[Quote, str]]:
+        """
+        Get a simulated quote; simulated quotes never fail.
+        
+        Args:
+            symbol: Trading pair symbol
+            size_notional: Size in notional currency
+            side: "buy" or "sell"
+            
+        Returns:
+            (True, simulated Quote)
+        """
+        return True, await self.get_quote(symbol, size_notional, side)
+    
+    async def get_quotes_batch(
+        self,
+        symbol: str,
+        sizes: List[float],
+        side: str
+    ) -> List[Quote]:
+        """
+        Get simulated quotes for several sizes of the same trade.
+        
+        Args:
+            symbol: Trading pair symbol
+            sizes: Sizes in notional currency
+            side: "buy" or "sell"
+            
+        Returns:
+            Simulated Quotes in size order
+        """
+        return [await self.get_quote(symbol, size, side) for size in sizes]
 
 
 class MockMarketDataFetcher:
@@ -87,7 +169,8 @@ class MockMarketDataFetcher:
     def __init__(
         self,
         base_price: float = 100.0,
-        price_volatility: float = 0.02
+        price_volatility: float = 0.02,
+        seed: Optional[int] = None
     ):
         """
         Initialize mock market data fetcher.
@@ -95,10 +178,12 @@ class MockMarketDataFetcher:
         Args:
             base_price: Base price for market
             price_volatility: Price volatility for simulation
+            seed: Optional RNG seed for reproducible market data
         """
         self.base_price = base_price
         self.price_volatility = price_volatility
         self.current_price = base_price
+        self._samples = _SampleBuffer(seed)
     
     async def fetch_market_state(self, symbol: str):
         """
@@ -113,7 +198,7 @@ class MockMarketDataFetcher:
         from src.core.types import MarketState, MarketRegime
         
         # Random walk price
-        price_change = random.gauss(0, self.price_volatility)
+        price_change = self._samples.gauss(0, self.price_volatility)
         self.current_price *= (1 + price_change)
         
         # Keep price in reasonable range
@@ -121,10 +206,10 @@ class MockMarketDataFetcher:
         self.current_price = min(self.current_price, self.base_price * 1.5)
         
         # Generate synthetic market data
-        volume = random.uniform(5000, 15000)
-        spread_pct = random.uniform(0.01, 0.1)
+        volume = self._samples.uniform(5000, 15000)
+        spread_pct = self._samples.uniform(0.01, 0.1)
         
-        return MarketState(
+        return MarketState.fast_build(
             symbol=symbol,
             price=self.current_price,
             volume_24h=volume,
@@ -132,9 +217,82 @@ class MockMarketDataFetcher:
             ask=self.current_price * (1 + spread_pct / 100),
             ema_fast=self.current_price * 1.001,
             ema_slow=self.current_price * 0.999,
-            regime=random.choice(list(MarketRegime)),
+            regime=self._samples.choice(list(MarketRegime)),
             volatility=abs(price_change) * 10,
-            liquidity_score=random.uniform(0.6, 1.0),
-            mev_risk_score=random.uniform(0.0, 0.5),
-            latency_ms=random.uniform(50, 200)
+            liquidity_score=self._samples.uniform(0.6, 1.0),
+            mev_risk_score=self._samples.uniform(0.0, 0.5),
+            latency_ms=self._samples.uniform(50, 200)
         )
+    
+    def fetch_market_states_batch(self, symbol: str, n: int) -> List[Any]:
+        """
+        Generate n consecutive simulated market states in one NumPy pass.
+        
+        The random walk is compounded with a single cumulative product.
+        If that path leaves the +/-50% band it is recomputed step by step,
+        clipping after every step as fetch_market_state does, so both
+        methods follow the same path for the same price changes.
+        
+        Args:
+            symbol: Trading symbol
+            n: Number of states to generate
+            
+        Returns:
+            List of MarketState in time order
+        """
+        from src.core.types import MarketState, MarketRegime
+        
+        if n <= 0:
+            return []
+        
+        rng = self._samples.rng
+        regimes = list(MarketRegime)
+        
+        # Random walk prices
+        changes = rng.normal(0.0, self.price_volatility, n)
+        steps = 1 + changes
+        prices = self.current_price * np.cumprod(steps)
+        low = self.base_price * 0.5
+        high = self.base_price * 1.5
+        if prices.min() < low or prices.max() > high:
+            # A clipped step changes every later price, so walk the band edge
+            price = self.current_price
+            clipped = []
+            for step in steps.tolist():
+                price = min(max(price * step, low), high)
+                clipped.append(price)
+            prices = np.array(clipped)
+        self.current_price = float(prices[-1])
+        
+        # Generate synthetic market data
+        spread = rng.uniform(0.01, 0.1, n) / 100
+        bids = prices * (1 - spread)
+        asks = prices * (1 + spread)
+        volumes = rng.uniform(5000, 15000, n)
+        regime_idx = rng.integers(0, len(regimes), n)
+        volatility = np.abs(changes) * 10
+        liquidity = rng.uniform(0.6, 1.0, n)
+        mev_risk = rng.uniform(0.0, 0.5, n)
+        latency = rng.uniform(50, 200, n)
+        
+        return [
+            MarketState.fast_build(
+                symbol=symbol,
+                price=price,
+                volume_24h=volume,
+                bid=bid,
+                ask=ask,
+                ema_fast=price * 1.001,
+                ema_slow=price * 0.999,
+                regime=regimes[r],
+                volatility=vol,
+                liquidity_score=liq,
+                mev_risk_score=mev,
+                latency_ms=lat
+            )
+            for price, volume, bid, ask, r, vol, liq, mev, lat in zip(
+                prices.tolist(), volumes.tolist(), bids.tolist(), asks.tolist(),
+                regime_idx.tolist(), volatility.tolist(), liquidity.tolist(),
+                mev_risk.tolist(), latency.tolist()
+            )
+        ]
@@ -8,16 +8,39 @@ Implements MarketDataFetcher protocol to fetch live market data from:
 """
 import asyncio
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+import math
+import random
+import time
+from typing import Optional, Dict, Any, List, Tuple, Union
 import aiohttp
+import numpy as np
+import orjson
+from yarl import URL
 
+from src.adapters._ema_kernels import (
+    REGIME_RANGING,
+    REGIME_TRENDING_DOWN,
+    REGIME_TRENDING_UP,
+    update_ema_regime,
+    update_ema_regime_vec,
+)
 from src.core.types import MarketState, MarketRegime
 
 
 logger = logging.getLogger(__name__)
 
 
+# Regime code from the EMA kernels -> MarketRegime
+_REGIME_BY_CODE = {
+    REGIME_RANGING: MarketRegime.RANGING,
+    REGIME_TRENDING_UP: MarketRegime.TRENDING_UP,
+    REGIME_TRENDING_DOWN: MarketRegime.TRENDING_DOWN,
+}
+
+# EMA state for a symbol that has not been priced yet (seeds from first price)
+_UNSEEDED_EMA = (math.nan, math.nan)
+
+
 class RealTimeMarketDataFetcher:
     """
     Fetches real-time market data from live Solana APIs.
@@ -26,13 +49,17 @@ class RealTimeMarketDataFetcher:
     Implements exponential backoff for rate limiting.
     """
     
+    # USDC base units -> USDC
+    _USDC_SCALE = 1e-6
+    
     def __init__(
         self,
         jupiter_endpoint: str = "https://quote-api.jup.ag/v6",
         birdeye_endpoint: str = "https://public-api.birdeye.so",
         birdeye_api_key: Optional[str] = None,
         timeout_sec: float = 5.0,
-        max_retries: int = 3
+        max_retries: int = 3,
+        symbol_mints: Optional[Dict[str, Tuple[str, int]]] = None
     ):
         """
         Initialize real-time market data fetcher.
@@ -43,35 +70,103 @@ class RealTimeMarketDataFetcher:
             birdeye_api_key: Optional Birdeye API key for higher rate limits
             timeout_sec: HTTP request timeout
             max_retries: Maximum retry attempts on failure
+            symbol_mints: Map of symbol -> (token mint, token decimals)
+                priced against USDC (defaults to SOL/USD only)
         """
         self.jupiter_endpoint = jupiter_endpoint
         self.birdeye_endpoint = birdeye_endpoint
         self.birdeye_api_key = birdeye_api_key
         self.timeout_sec = timeout_sec
         self.max_retries = max_retries
+        self._backoff_cap = 4.0  # Max seconds between retries
+        self._jupiter_quote_url = URL(f"{jupiter_endpoint}/quote")
+        self._birdeye_overview_url = URL(f"{birdeye_endpoint}/defi/token_overview")
         
         # SOL token mint address
         self.sol_mint = "So11111111111111111111111111111111111111112"
         self.usdc_mint = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+        self.symbol_mints = symbol_mints or {"SOL/USD": (self.sol_mint, 9)}
+        
+        # Price-probe URLs are constant per mint, so build them once
+        self._jupiter_price_urls: Dict[str, URL] = {
+            mint: self._build_jupiter_price_url(mint, decimals)
+            for mint, decimals in self.symbol_mints.values()
+        }
         
-        # Cache for reducing API calls
-        self._price_cache: Optional[Dict[str, Any]] = None
-        self._cache_timestamp: Optional[datetime] = None
+        # Per-symbol cache for reducing API calls: symbol -> (monotonic fetched_at, state)
+        self._state_cache: Dict[str, Tuple[float, MarketState]] = {}
         self._cache_ttl_sec = 2.0  # Cache for 2 seconds
         
-        # EMA state tracking
-        self._ema_fast = None
-        self._ema_slow = None
+        # Per-symbol EMA state tracking: symbol -> (ema_fast, ema_slow)
+        self._ema_state: Dict[str, Tuple[float, float]] = {}
         self._ema_fast_alpha = 0.2  # ~10 period EMA
         self._ema_slow_alpha = 0.067  # ~30 period EMA
         
+        # Long-lived HTTP session (created lazily, reused across fetches)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
         logger.info(f"Initialized RealTimeMarketDataFetcher with Jupiter: {jupiter_endpoint}")
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use.
+        
+        Reusing one session keeps TCP/TLS connections to Jupiter and
+        Birdeye alive between polls.
+        
+        Returns:
+            Shared aiohttp session
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout_sec)
+            )
+        return self._session
+    
+    async def warmup(self):
+        """
+        Resolve DNS and open keep-alive connections to Jupiter and Birdeye.
+        
+        Failures are logged and ignored; the first real fetch will retry.
+        """
+        session = await self._get_session()
+        
+        async def touch(url: URL):
+            try:
+                async with session.get(url) as response:
+                    await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning("Warmup request to %s failed: %s", url.host, e)
+        
+        await asyncio.gather(
+            touch(self._build_jupiter_price_url(self.sol_mint, 9)),
+            touch(self._birdeye_overview_url.with_query({"address": self.sol_mint}))
+        )
+    
+    async def aclose(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def __aenter__(self) -> "RealTimeMarketDataFetcher":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
     async def _get_with_retry(
         self,
         session: aiohttp.ClientSession,
-        url: str,
-        headers: Optional[Dict[str, str]] = None
+        url: Union[str, URL],
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
         """
         Make HTTP GET request with exponential backoff retry.
@@ -80,6 +175,7 @@ class RealTimeMarketDataFetcher:
             session: aiohttp session
             url: URL to fetch
             headers: Optional HTTP headers
+            params: Optional query parameters (encoded by aiohttp)
             
         Returns:
             JSON response as dict
@@ -92,15 +188,17 @@ class RealTimeMarketDataFetcher:
                 async with session.get(
                     url,
                     headers=headers,
+                    params=params,
                     timeout=aiohttp.ClientTimeout(total=self.timeout_sec)
                 ) as response:
                     response.raise_for_status()
-                    return await response.json()
+                    return orjson.loads(await response.read())
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
+                # Jittered, capped exponential backoff so concurrent fetches don't retry in lockstep
+                wait_time = min(self._backoff_cap, random.uniform(0.1, (2 ** attempt) * 0.5))
                 logger.warning(
                     f"Request failed (attempt {attempt + 1}/{self.max_retries}): {e}. "
-                    f"Retrying in {wait_time}s..."
+                    f"Retrying in {wait_time:.2f}s..."
                 )
                 if attempt < self.max_retries - 1:
                     await asyncio.sleep(wait_time)
@@ -108,30 +206,49 @@ class RealTimeMarketDataFetcher:
                     logger.error(f"All {self.max_retries} attempts failed for {url}")
                     raise
     
-    async def _fetch_jupiter_price(self, session: aiohttp.ClientSession) -> float:
+    def _build_jupiter_price_url(self, mint: str, decimals: int) -> URL:
         """
-        Fetch current SOL/USDC price from Jupiter.
+        Build the Jupiter quote URL used to price 1 token in USDC.
         
         Args:
-            session: aiohttp session
+            mint: Token mint to price
+            decimals: Token decimals
             
         Returns:
-            Current SOL price in USDC
+            Fully-encoded quote URL
         """
-        # Jupiter quote API: get a quote for 1 SOL -> USDC
-        url = f"{self.jupiter_endpoint}/quote"
-        params = {
-            "inputMint": self.sol_mint,
+        return self._jupiter_quote_url.with_query({
+            "inputMint": mint,
             "outputMint": self.usdc_mint,
-            "amount": str(10**9),  # 1 SOL in lamports
+            "amount": str(10**decimals),  # 1 whole token in base units
             "slippageBps": "50"  # 0.5% slippage tolerance
-        }
+        })
+    
+    async def _fetch_jupiter_price(
+        self,
+        session: aiohttp.ClientSession,
+        mint: Optional[str] = None,
+        decimals: int = 9
+    ) -> float:
+        """
+        Fetch current token/USDC price from Jupiter.
         
-        # Build query string
-        query = "&".join(f"{k}={v}" for k, v in params.items())
-        full_url = f"{url}?{query}"
+        Args:
+            session: aiohttp session
+            mint: Token mint to price (defaults to SOL)
+            decimals: Token decimals
+            
+        Returns:
+            Current token price in USDC
+        """
+        # Jupiter quote API: get a quote for 1 token -> USDC
+        mint = mint or self.sol_mint
+        url = self._jupiter_price_urls.get(mint)
+        if url is None:
+            url = self._build_jupiter_price_url(mint, decimals)
+            self._jupiter_price_urls[mint] = url
         
-        data = await self._get_with_retry(session, full_url)
+        data = await self._get_with_retry(session, url)
         
         # Extract price from quote
         out_amount = int(data.get("outAmount", 0))
@@ -139,35 +256,36 @@ class RealTimeMarketDataFetcher:
             raise ValueError("Invalid Jupiter quote response: outAmount is 0")
         
         # Convert USDC (6 decimals) to price
-        price = out_amount / 10**6
+        price = out_amount * self._USDC_SCALE
         
-        logger.debug(f"Jupiter price: {price} USDC per SOL")
+        logger.debug("Jupiter price: %s USDC per token", price)
         return price
     
     async def _fetch_birdeye_metrics(
         self,
-        session: aiohttp.ClientSession
+        session: aiohttp.ClientSession,
+        mint: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Fetch volume and market metrics from Birdeye.
         
         Args:
             session: aiohttp session
+            mint: Token mint to look up (defaults to SOL)
             
         Returns:
             Dict with volume_24h, liquidity, etc.
         """
-        url = f"{self.birdeye_endpoint}/defi/token_overview"
-        params = {"address": self.sol_mint}
-        query = "&".join(f"{k}={v}" for k, v in params.items())
-        full_url = f"{url}?{query}"
+        params = {"address": mint or self.sol_mint}
         
         headers = {}
         if self.birdeye_api_key:
             headers["X-API-KEY"] = self.birdeye_api_key
         
         try:
-            data = await self._get_with_retry(session, full_url, headers)
+            data = await self._get_with_retry(
+                session, self._birdeye_overview_url, headers, params
+            )
             
             # Extract metrics from response
             token_data = data.get("data", {})
@@ -186,57 +304,162 @@ class RealTimeMarketDataFetcher:
                 "price_change_24h": 0.0
             }
     
+    def _get_cached_state(self, symbol: str, now: float) -> Optional[MarketState]:
+        """Return the cached state for a symbol if it is still fresh."""
+        cached = self._state_cache.get(symbol)
+        if cached is not None and now - cached[0] < self._cache_ttl_sec:
+            return cached[1]
+        return None
+    
+    def _resolve_mint(self, symbol: str) -> Tuple[str, int]:
+        """
+        Look up the token mint and decimals for a symbol.
+        
+        Raises:
+            ValueError: If the symbol is not configured
+        """
+        try:
+            return self.symbol_mints[symbol]
+        except KeyError:
+            raise ValueError(f"Unsupported symbol: {symbol}") from None
+    
     async def fetch_market_state(self, symbol: str = "SOL/USD") -> MarketState:
         """
         Fetch current market state from real APIs.
         
         Args:
-            symbol: Trading pair (currently only SOL/USD supported)
+            symbol: Trading pair (must be present in symbol_mints)
             
         Returns:
             MarketState with real-time data
         """
         # Check cache
-        now = datetime.utcnow()
-        if (self._price_cache is not None and 
-            self._cache_timestamp is not None and
-            (now - self._cache_timestamp).total_seconds() < self._cache_ttl_sec):
+        now = time.monotonic()
+        cached = self._get_cached_state(symbol, now)
+        if cached is not None:
             logger.debug("Using cached market data")
-            return self._price_cache
+            return cached
+        
+        mint, decimals = self._resolve_mint(symbol)
+        session = await self._get_session()
+        
+        # Fetch data from multiple sources in parallel
+        price_task = self._fetch_jupiter_price(session, mint, decimals)
+        metrics_task = self._fetch_birdeye_metrics(session, mint)
+        
+        price, metrics = await asyncio.gather(price_task, metrics_task)
+        
+        # Everything below is synchronous; no awaits after the I/O completes
+        return self._build_market_state(symbol, price, metrics, now)
+    
+    async def fetch_market_states(self, symbols: List[str]) -> Dict[str, MarketState]:
+        """
+        Fetch market state for several symbols in one concurrent round.
         
-        async with aiohttp.ClientSession() as session:
-            # Fetch data from multiple sources in parallel
-            price_task = self._fetch_jupiter_price(session)
-            metrics_task = self._fetch_birdeye_metrics(session)
+        All Jupiter and Birdeye requests for uncached symbols are issued
+        together over the shared session.
+        
+        Args:
+            symbols: Trading pairs (each must be present in symbol_mints)
+            
+        Returns:
+            Dict of symbol -> MarketState
+        """
+        now = time.monotonic()
+        states: Dict[str, MarketState] = {}
+        pending: List[Tuple[str, str, int]] = []
+        
+        for symbol in dict.fromkeys(symbols):
+            cached = self._get_cached_state(symbol, now)
+            if cached is not None:
+                states[symbol] = cached
+            else:
+                pending.append((symbol, *self._resolve_mint(symbol)))
+        
+        if pending:
+            session = await self._get_session()
+            price_tasks = [
+                self._fetch_jupiter_price(session, mint, decimals)
+                for _, mint, decimals in pending
+            ]
+            metrics_tasks = [
+                self._fetch_birdeye_metrics(session, mint)
+                for _, mint, _ in pending
+            ]
+            results = await asyncio.gather(*price_tasks, *metrics_tasks)
             
-            price, metrics = await asyncio.gather(price_task, metrics_task)
+            n = len(pending)
+            for i, (symbol, _, _) in enumerate(pending):
+                states[symbol] = self._build_market_state(
+                    symbol, results[i], results[n + i], now
+                )
         
+        return states
+    
+    def replay_prices(
+        self,
+        symbol: str,
+        prices: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, List[MarketRegime]]:
+        """
+        Advance a symbol's EMAs through a historical price series in bulk.
+        
+        Continues from the symbol's current EMA state and leaves it at the
+        last price, as if each price had been fetched in turn.
+        
+        Args:
+            symbol: Trading pair
+            prices: Historical prices in time order
+            
+        Returns:
+            Tuple of (ema_fast, ema_slow, regimes), one entry per price
+        """
+        prev_fast, prev_slow = self._ema_state.get(symbol, _UNSEEDED_EMA)
+        ema_fast, ema_slow, codes = update_ema_regime_vec(
+            np.ascontiguousarray(prices, dtype=np.float64),
+            prev_fast, prev_slow, self._ema_fast_alpha, self._ema_slow_alpha
+        )
+        if ema_fast.shape[0]:
+            self._ema_state[symbol] = (float(ema_fast[-1]), float(ema_slow[-1]))
+        return ema_fast, ema_slow, [_REGIME_BY_CODE[code] for code in codes.tolist()]
+    
+    def _build_market_state(
+        self,
+        symbol: str,
+        price: float,
+        metrics: Dict[str, Any],
+        now: float
+    ) -> MarketState:
+        """
+        Build a MarketState from fetched price and metrics and cache it.
+        
+        Args:
+            symbol: Trading pair
+            price: Current price in USDC
+            metrics: Birdeye metrics dict
+            now: Monotonic fetch time used for the cache
+            
+        Returns:
+            MarketState with real-time data
+        """
         # Calculate bid/ask spread (estimate ~0.1% typical spread)
         spread_pct = 0.001
         bid = price * (1 - spread_pct / 2)
         ask = price * (1 + spread_pct / 2)
         
-        # Update EMAs
-        if self._ema_fast is None:
-            self._ema_fast = price
-            self._ema_slow = price
-        else:
-            self._ema_fast = self._ema_fast_alpha * price + (1 - self._ema_fast_alpha) * self._ema_fast
-            self._ema_slow = self._ema_slow_alpha * price + (1 - self._ema_slow_alpha) * self._ema_slow
+        # Update EMAs and determine market regime
+        prev_fast, prev_slow = self._ema_state.get(symbol, _UNSEEDED_EMA)
+        ema_fast, ema_slow, regime_code = update_ema_regime(
+            price, prev_fast, prev_slow, self._ema_fast_alpha, self._ema_slow_alpha
+        )
+        self._ema_state[symbol] = (ema_fast, ema_slow)
+        regime = _REGIME_BY_CODE[regime_code]
         
         # Calculate volatility from price change
         volatility = abs(metrics.get("price_change_24h", 0)) / 100.0
         if volatility == 0:
             volatility = 0.02  # Fallback: 2% volatility
         
-        # Determine market regime
-        if self._ema_fast > self._ema_slow * 1.02:
-            regime = MarketRegime.TRENDING_UP
-        elif self._ema_fast < self._ema_slow * 0.98:
-            regime = MarketRegime.TRENDING_DOWN
-        else:
-            regime = MarketRegime.RANGING
-        
         # Calculate liquidity score (normalized 0-1)
         liquidity_raw = metrics.get("liquidity", 0)
         liquidity_score = min(1.0, liquidity_raw / 1_000_000_000)  # Normalize to 1B
@@ -248,12 +471,13 @@ class RealTimeMarketDataFetcher:
         latency_ms = 150.0  # Typical Solana RPC latency (150ms)
         
         market_state = MarketState(
+            symbol=symbol,
             price=price,
             volume_24h=metrics.get("volume_24h", 0),
             bid=bid,
             ask=ask,
-            ema_fast=self._ema_fast,
-            ema_slow=self._ema_slow,
+            ema_fast=ema_fast,
+            ema_slow=ema_slow,
             regime=regime,
             volatility=volatility,
             liquidity_score=liquidity_score,
@@ -262,13 +486,11 @@ class RealTimeMarketDataFetcher:
         )
         
         # Update cache
-        self._price_cache = market_state
-        self._cache_timestamp = now
+        self._state_cache[symbol] = (now, market_state)
         
         logger.info(
-            f"Fetched market state: price=${price:.2f}, "
-            f"volume=${metrics.get('volume_24h', 0)/1e9:.2f}B, "
-            f"regime={regime.value}"
+            "Fetched market state: %s price=$%.2f, volume=$%.2fB, regime=%s",
+            symbol, price, metrics.get("volume_24h", 0) / 1e9, regime.value
         )
         
         return market_state
@@ -0,0 +1,79 @@
+"""
+Numeric kernels for HyperEnsemble vote aggregation.
+
+The reduction runs over plain arrays so it can be JIT-compiled with Numba
+when it is installed. Without Numba an equivalent NumPy implementation is
+used; both break weight ties by vote count, then by lowest action index.
+"""
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _aggregate_loop(
+    ids: np.ndarray,
+    confs: np.ndarray,
+    n_actions: int
+) -> Tuple[int, float, int, float]:
+    """
+    Single-pass per-action accumulate followed by argmax.
+
+    Args:
+        ids: Action index per vote (int8)
+        confs: Confidence per vote (float64)
+        n_actions: Number of action types
+
+    Returns:
+        Tuple of (best_idx, best_weight, best_count, total_weight)
+    """
+    weights = np.zeros(n_actions, dtype=np.float64)
+    counts = np.zeros(n_actions, dtype=np.int64)
+    total = 0.0
+    for i in range(ids.shape[0]):
+        weights[ids[i]] += confs[i]
+        counts[ids[i]] += 1
+        total += confs[i]
+
+    best = 0
+    for j in range(1, n_actions):
+        if weights[j] > weights[best] or (
+            weights[j] == weights[best] and counts[j] > counts[best]
+        ):
+            best = j
+    return best, weights[best], counts[best], total
+
+
+def _aggregate_numpy(
+    ids: np.ndarray,
+    confs: np.ndarray,
+    n_actions: int
+) -> Tuple[int, float, int, float]:
+    """
+    NumPy equivalent of _aggregate_loop for when Numba is unavailable.
+
+    Args:
+        ids: Action index per vote (int8)
+        confs: Confidence per vote (float64)
+        n_actions: Number of action types
+
+    Returns:
+        Tuple of (best_idx, best_weight, best_count, total_weight)
+    """
+    weights = np.bincount(ids, weights=confs, minlength=n_actions)
+    counts = np.bincount(ids, minlength=n_actions)
+    candidates = np.flatnonzero(weights == weights.max())
+    best = int(candidates[np.argmax(counts[candidates])])
+    return best, float(weights[best]), int(counts[best]), float(confs.sum())
+
+
+if NUMBA_AVAILABLE:
+    aggregate = njit(cache=True)(_aggregate_loop)
+    # Compile on import so the first trading tick doesn't pay for it
+    aggregate(np.zeros(1, dtype=np.int8), np.zeros(1, dtype=np.float64), 1)
+else:
+    aggregate = _aggregate_numpy
@@ -0,0 +1,96 @@
+"""
+Numeric kernels for OnflowEngine EWMA tracking and Kelly sizing.
+
+Kernels take and return plain floats so they can be JIT-compiled with Numba
+when it is installed, and stay cheap as ordinary Python functions when not.
+"""
+from typing import Tuple
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _ewma_update(
+    win_rate: float,
+    avg_return: float,
+    volatility: float,
+    alpha: float,
+    decay: float,
+    win_value: float,
+    return_pct: float,
+    trade_volatility: float
+) -> Tuple[float, float, float]:
+    """
+    Advance the win-rate, return and volatility EWMAs by one trade.
+
+    Args:
+        win_rate: Current EWMA win rate
+        avg_return: Current EWMA return percentage
+        volatility: Current EWMA volatility
+        alpha: EWMA smoothing factor
+        decay: Precomputed complement 1 - alpha
+        win_value: 1.0 for a winning trade, 0.0 otherwise
+        return_pct: Trade return percentage
+        trade_volatility: Market volatility at trade time
+
+    Returns:
+        Tuple of updated (win_rate, avg_return, volatility)
+    """
+    return (
+        alpha * win_value + decay * win_rate,
+        alpha * return_pct + decay * avg_return,
+        alpha * trade_volatility + decay * volatility
+    )
+
+
+def _kelly_allocation(
+    win_rate: float,
+    avg_return: float,
+    ewma_volatility: float,
+    market_volatility: float,
+    kelly_fraction: float,
+    min_allocation: float
+) -> float:
+    """
+    Unclamped fractional-Kelly allocation: edge / volatility^2, scaled.
+
+    Args:
+        win_rate: EWMA win rate
+        avg_return: EWMA return percentage
+        ewma_volatility: EWMA volatility from past trades
+        market_volatility: Current market volatility
+        kelly_fraction: Fraction of full Kelly to use
+        min_allocation: Fallback when volatility is not positive
+
+    Returns:
+        Allocation fraction before clamping to bounds
+    """
+    # Convert percentage to fraction
+    edge = avg_return / 100.0
+
+    # Use volatility as risk measure
+    volatility = market_volatility if market_volatility > 0 else 0.1
+    if ewma_volatility > 0:
+        volatility = (volatility + ewma_volatility) / 2
+
+    # Fractional Kelly for safety, boosted when winning consistently
+    mult = kelly_fraction * (0.5 + win_rate * 0.5)
+
+    if volatility > 0:
+        inv_var = 1.0 / (volatility * volatility)
+        return edge * inv_var * mult
+    return min_allocation * mult
+
+
+if NUMBA_AVAILABLE:
+    ewma_update = njit(cache=True)(_ewma_update)
+    kelly_allocation = njit(cache=True)(_kelly_allocation)
+    # Compile on import so the first trade doesn't pay for it
+    ewma_update(0.0, 0.0, 0.0, 0.5, 0.5, 1.0, 0.0, 0.0)
+    kelly_allocation(0.5, 0.0, 0.0, 0.0, 0.25, 0.01)
+else:
+    ewma_update = _ewma_update
+    kelly_allocation = _kelly_allocation
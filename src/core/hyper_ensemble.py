@@ -6,11 +6,64 @@ computes consensus confidence. Provides run_and_assert for minimum
 confidence enforcement.
 """
 import asyncio
-from typing import List, Optional, Callable
+import logging
+import sys
+import time
+import numpy as np
+from typing import Dict, List, Optional, Callable, Tuple
 from src.core.types import (
     MarketState, Action, Decision, EngineVote,
-    ActionType, DecisionStatus
+    ActionType, DecisionStatus, ACTIONS, ACTION_INDEX, ACTION_COUNT
 )
+from src.core._ensemble_kernels import aggregate
+
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between failure warnings for the same engine
+_WARN_INTERVAL_SEC = 1.0
+
+_HAS_TASKGROUP = sys.version_info >= (3, 11)
+
+
+def _make_vote(engine_name: str, action_type: ActionType, confidence: float) -> EngineVote:
+    """
+    Wrap an engine's output in an EngineVote without full Pydantic validation.
+    
+    Only the two engine-supplied values are checked; everything else is
+    fixed here, so model_construct is safe and much cheaper than __init__.
+    
+    Args:
+        engine_name: Engine name
+        action_type: Action type returned by the engine
+        confidence: Confidence returned by the engine
+        
+    Returns:
+        EngineVote
+        
+    Raises:
+        ValueError: If action_type is not an ActionType or confidence is outside [0, 1]
+    """
+    action_type = ActionType(action_type)
+    # model_construct skips coercion; numpy scalars and ints become float here
+    confidence = float(confidence)
+    if not 0.0 <= confidence <= 1.0:
+        raise ValueError(f"confidence {confidence} outside [0, 1]")
+    
+    action = Action.model_construct(
+        action_type=action_type,
+        size=1.0,  # Size to be adjusted by leverage engine
+        confidence=confidence
+    )
+    return EngineVote.model_construct(
+        engine_name=engine_name,
+        action=action,
+        confidence=confidence
+    )
+
+
+# Below this many votes the array setup cost outweighs the Python loop
+_NUMPY_MIN_VOTES = 8
 
 
 class HyperEnsemble:
@@ -21,10 +74,20 @@ class HyperEnsemble:
     voting. Can run engines synchronously or asynchronously.
     """
     
+    __slots__ = (
+        "engines",
+        "vote_aggregation_method",
+        "record_votes",
+        "_engine_specs",
+        "_has_async",
+        "_last_warn_ts",
+    )
+    
     def __init__(
         self,
         engines: Optional[List[tuple[str, Callable]]] = None,
-        vote_aggregation_method: str = "weighted"
+        vote_aggregation_method: str = "weighted",
+        record_votes: bool = True
     ):
         """
         Initialize HyperEnsemble.
@@ -32,19 +95,52 @@ class HyperEnsemble:
         Args:
             engines: List of (name, engine_callable) tuples
             vote_aggregation_method: Method for aggregating votes ("weighted", "majority")
+            record_votes: Fill Decision.engine_votes and the vote-count reason.
+                Disable for bulk runs that only read the action and confidence.
         """
         self.engines = engines or []
         self.vote_aggregation_method = vote_aggregation_method
+        self.record_votes = record_votes
+        # (name, callable, is_coroutine, blocking, trusted), classified once at registration
+        self._engine_specs: List[Tuple[str, Callable, bool, bool, bool]] = [
+            (name, engine_callable, asyncio.iscoroutinefunction(engine_callable), False, False)
+            for name, engine_callable in self.engines
+        ]
+        # Whether run_async needs to await anything at all
+        self._has_async = any(is_coro for _, _, is_coro, _, _ in self._engine_specs)
+        # Last failure-warning time per engine (monotonic), for rate limiting
+        self._last_warn_ts: Dict[str, float] = {}
     
-    def add_engine(self, name: str, engine_callable: Callable):
+    def add_engine(
+        self,
+        name: str,
+        engine_callable: Callable,
+        *,
+        blocking: bool = False,
+        trusted: bool = False
+    ):
         """
         Add an engine to the ensemble.
         
         Args:
             name: Engine name
             engine_callable: Callable that takes MarketState and returns (ActionType, confidence)
+            blocking: Sync engine does blocking I/O; run_async dispatches it to
+                the default executor instead of calling it inline
+            trusted: Sync engine never raises; it is called without the
+                per-engine try/except, so any exception propagates to the caller
+                
+        Raises:
+            ValueError: If trusted is set on a coroutine engine
         """
+        is_coro = asyncio.iscoroutinefunction(engine_callable)
+        if trusted and is_coro:
+            raise ValueError(f"Engine {name}: trusted applies to sync engines only")
+        
         self.engines.append((name, engine_callable))
+        self._engine_specs.append((name, engine_callable, is_coro, blocking, trusted))
+        if is_coro or blocking:
+            self._has_async = True
     
     def run_sync(self, market_state: MarketState) -> Decision:
         """
@@ -58,31 +154,55 @@ class HyperEnsemble:
         """
         votes: List[EngineVote] = []
         
-        for engine_name, engine_callable in self.engines:
-            try:
-                # Engine should return (ActionType, confidence)
-                action_type, confidence = engine_callable(market_state)
-                
-                # Create action with basic sizing
-                action = Action(
-                    action_type=action_type,
-                    size=1.0,  # Size to be adjusted by leverage engine
-                    confidence=confidence
-                )
-                
-                vote = EngineVote(
-                    engine_name=engine_name,
-                    action=action,
-                    confidence=confidence
-                )
-                votes.append(vote)
-            except Exception as e:
-                # Engine failed, skip it
-                print(f"Warning: Engine {engine_name} failed: {e}")
+        for engine_name, engine_callable, _, _, trusted in self._engine_specs:
+            if trusted:
+                votes.append(_make_vote(engine_name, *engine_callable(market_state)))
                 continue
+            vote = self._run_engine_sync(engine_name, engine_callable, market_state)
+            if vote is not None:
+                votes.append(vote)
         
         return self._aggregate_votes(votes, market_state)
     
+    def _run_engine_sync(
+        self,
+        engine_name: str,
+        engine_callable: Callable,
+        market_state: MarketState
+    ) -> Optional[EngineVote]:
+        """
+        Call one sync engine and wrap its output in an EngineVote.
+        
+        Args:
+            engine_name: Engine name
+            engine_callable: Sync engine callable
+            market_state: Current market state
+            
+        Returns:
+            EngineVote, or None if the engine raised
+        """
+        try:
+            # Engine should return (ActionType, confidence)
+            action_type, confidence = engine_callable(market_state)
+            return _make_vote(engine_name, action_type, confidence)
+        except Exception as e:
+            # Engine failed, skip it
+            self._warn_engine_failed(engine_name, e)
+            return None
+    
+    def _warn_engine_failed(self, engine_name: str, error: Exception):
+        """
+        Log an engine failure, at most once per _WARN_INTERVAL_SEC per engine.
+        
+        Args:
+            engine_name: Engine name
+            error: Exception raised by the engine
+        """
+        now = time.monotonic()
+        if now - self._last_warn_ts.get(engine_name, float("-inf")) >= _WARN_INTERVAL_SEC:
+            self._last_warn_ts[engine_name] = now
+            logger.warning("Engine %s failed: %s", engine_name, error)
+    
     async def run_async(self, market_state: MarketState) -> Decision:
         """
         Run all engines asynchronously and aggregate votes.
@@ -93,32 +213,64 @@ class HyperEnsemble:
         Returns:
             Decision with aggregated action and consensus confidence
         """
-        async def run_engine(name: str, engine_callable: Callable) -> Optional[EngineVote]:
+        if not self._has_async:
+            # Nothing to await; skip coroutine and task creation entirely
+            return self.run_sync(market_state)
+        
+        loop = asyncio.get_running_loop()
+        
+        async def run_engine(
+            name: str,
+            engine_callable: Callable,
+            is_coro: bool
+        ) -> Optional[EngineVote]:
             try:
                 # If engine is async
-                if asyncio.iscoroutinefunction(engine_callable):
+                if is_coro:
                     action_type, confidence = await engine_callable(market_state)
                 else:
-                    action_type, confidence = engine_callable(market_state)
+                    action_type, confidence = await loop.run_in_executor(
+                        None, engine_callable, market_state
+                    )
                 
-                action = Action(
-                    action_type=action_type,
-                    size=1.0,
-                    confidence=confidence
-                )
-                
-                return EngineVote(
-                    engine_name=name,
-                    action=action,
-                    confidence=confidence
-                )
+                return _make_vote(name, action_type, confidence)
             except Exception as e:
-                print(f"Warning: Engine {name} failed: {e}")
+                self._warn_engine_failed(name, e)
                 return None
         
-        # Run all engines concurrently
-        tasks = [run_engine(name, engine) for name, engine in self.engines]
-        results = await asyncio.gather(*tasks)
+        # Sync engines run inline (cheaper than a thread hop); only async and
+        # blocking engines are gathered. Slots keep registration order.
+        results: List[Optional[EngineVote]] = []
+        pending = []
+        try:
+            for name, engine_callable, is_coro, blocking, trusted in self._engine_specs:
+                if is_coro or blocking:
+                    pending.append((len(results), run_engine(name, engine_callable, is_coro)))
+                    results.append(None)
+                elif trusted:
+                    results.append(_make_vote(name, *engine_callable(market_state)))
+                else:
+                    results.append(self._run_engine_sync(name, engine_callable, market_state))
+        except BaseException:
+            # A trusted engine raised; close the coroutines already built so
+            # they aren't left unawaited
+            for _, coro in pending:
+                coro.close()
+            raise
+        
+        if len(pending) == 1:
+            slot, coro = pending[0]
+            results[slot] = await coro
+        elif len(pending) > 1:
+            if _HAS_TASKGROUP:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [(slot, tg.create_task(coro)) for slot, coro in pending]
+                for slot, task in tasks:
+                    results[slot] = task.result()
+            else:
+                gathered = await asyncio.gather(*(coro for _, coro in pending))
+                for (slot, _), vote in zip(pending, gathered):
+                    results[slot] = vote
         
         # Filter out failed engines
         votes = [v for v in results if v is not None]
@@ -154,37 +306,81 @@ class HyperEnsemble:
                 engine_votes={}
             )
         
-        # Count votes by action type, weighted by confidence
-        vote_weights: dict[ActionType, float] = {}
-        vote_counts: dict[ActionType, int] = {}
-        
-        for vote in votes:
-            action_type = vote.action.action_type
-            vote_weights[action_type] = vote_weights.get(action_type, 0.0) + vote.confidence
-            vote_counts[action_type] = vote_counts.get(action_type, 0) + 1
+        if len(votes) == 1:
+            # A lone vote is unanimous: full consensus unless it carries no confidence
+            chosen_action_type = votes[0].action.action_type
+            consensus_confidence = 1.0 if votes[0].confidence > 0 else 0.0
+        else:
+            # Count votes by action type, weighted by confidence
+            if len(votes) >= _NUMPY_MIN_VOTES:
+                ids = np.fromiter(
+                    (ACTION_INDEX[vote.action.action_type] for vote in votes),
+                    dtype=np.int8,
+                    count=len(votes)
+                )
+                confs = np.fromiter(
+                    (vote.confidence for vote in votes),
+                    dtype=np.float64,
+                    count=len(votes)
+                )
+                chosen_idx, chosen_weight, chosen_count, total_confidence = aggregate(
+                    ids, confs, ACTION_COUNT
+                )
+            else:
+                vote_weights = [0.0] * ACTION_COUNT
+                vote_counts = [0] * ACTION_COUNT
+                action_index = ACTION_INDEX
+            
+                # Track the leader while accumulating (highest weight, then most
+                # votes, then lowest index, matching the array kernel)
+                chosen_idx = 0
+                chosen_weight = 0.0
+                chosen_count = 0
+                total_confidence = 0.0
+            
+                for vote in votes:
+                    confidence = vote.confidence
+                    idx = action_index[vote.action.action_type]
+                    weight = vote_weights[idx] + confidence
+                    count = vote_counts[idx] + 1
+                    vote_weights[idx] = weight
+                    vote_counts[idx] = count
+                    total_confidence += confidence
+                
+                    if weight > chosen_weight or (weight == chosen_weight and (
+                        count > chosen_count or (count == chosen_count and idx < chosen_idx)
+                    )):
+                        chosen_idx = idx
+                        chosen_weight = weight
+                        chosen_count = count
         
-        # Select action with highest weighted vote
-        chosen_action_type = max(vote_weights, key=vote_weights.get)
+            chosen_action_type = ACTIONS[int(chosen_idx)]
         
-        # Compute consensus confidence
-        total_confidence = sum(vote_weights.values())
-        if total_confidence > 0:
-            consensus_confidence = vote_weights[chosen_action_type] / total_confidence
-        else:
-            consensus_confidence = 0.0
+            # Compute consensus confidence
+            if total_confidence > 0:
+                consensus_confidence = chosen_weight / total_confidence
+            else:
+                consensus_confidence = 0.0
         
-        # Adjust consensus by agreement (boost if multiple engines agree)
-        agreement_factor = vote_counts[chosen_action_type] / len(votes)
-        consensus_confidence = consensus_confidence * (0.7 + 0.3 * agreement_factor)
-        consensus_confidence = min(consensus_confidence, 1.0)
+            # Adjust consensus by agreement (boost if multiple engines agree)
+            agreement_factor = chosen_count / len(votes)
+            consensus_confidence = consensus_confidence * (0.7 + 0.3 * agreement_factor)
+            consensus_confidence = min(consensus_confidence, 1.0)
         
-        # Create final action
-        final_action = Action(
+        # Create final action (fields computed above are already in range)
+        final_action = Action.model_construct(
             action_type=chosen_action_type,
             size=1.0,  # Will be sized by leverage engine
             confidence=consensus_confidence
         )
         
+        if not self.record_votes:
+            return Decision.model_construct(
+                action=final_action,
+                consensus_confidence=consensus_confidence,
+                status=DecisionStatus.APPROVED
+            )
+        
         # Build engine votes dict for transparency
         engine_votes_dict = {
             vote.engine_name: {
@@ -194,7 +390,7 @@ class HyperEnsemble:
             for vote in votes
         }
         
-        return Decision(
+        return Decision.model_construct(
             action=final_action,
             consensus_confidence=consensus_confidence,
             status=DecisionStatus.APPROVED,
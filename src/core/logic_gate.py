@@ -8,6 +8,22 @@ from typing import List
 from src.core.types import MarketState, Action, FilterResult
 
 
+# Rule bits, in order of how often they reject
+_MEV = 1
+_LATENCY = 2
+_VOLUME = 4
+_EMA = 8
+_SPREAD = 16
+
+_RULE_WEIGHTS = (0.3, 0.2, 0.2, 0.2, 0.1)
+
+# Capped risk score for every combination of failed rules
+_RISK_BY_MASK = tuple(
+    min(sum(w for i, w in enumerate(_RULE_WEIGHTS) if mask >> i & 1), 1.0)
+    for mask in range(1 << len(_RULE_WEIGHTS))
+)
+
+
 class LogicGate:
     """
     Deterministic filter that blocks actions based on risk rules.
@@ -17,6 +33,16 @@ class LogicGate:
     should be tuned based on market characteristics.
     """
     
+    __slots__ = (
+        "max_mev_risk",
+        "max_latency_ms",
+        "min_volume_24h",
+        "_max_price_jump_pct",
+        "_max_ema_deviation_pct",
+        "_max_price_jump_frac",
+        "_max_ema_dev_frac",
+    )
+    
     def __init__(
         self,
         max_mev_risk: float = 0.7,
@@ -41,65 +67,108 @@ class LogicGate:
         self.max_ema_deviation_pct = max_ema_deviation_pct
         self.min_volume_24h = min_volume_24h
     
-    def check(self, market_state: MarketState, action: Action) -> FilterResult:
+    @property
+    def max_price_jump_pct(self) -> float:
+        """Maximum bid-ask spread, as a percentage of the bid."""
+        return self._max_price_jump_pct
+    
+    @max_price_jump_pct.setter
+    def max_price_jump_pct(self, value: float):
+        # Percent thresholds are kept as fractions so checks multiply instead of divide
+        self._max_price_jump_pct = value
+        self._max_price_jump_frac = value / 100.0
+    
+    @property
+    def max_ema_deviation_pct(self) -> float:
+        """Maximum price deviation from the EMA average, as a percentage."""
+        return self._max_ema_deviation_pct
+    
+    @max_ema_deviation_pct.setter
+    def max_ema_deviation_pct(self, value: float):
+        self._max_ema_deviation_pct = value
+        self._max_ema_dev_frac = value / 100.0
+    
+    def check(
+        self,
+        market_state: MarketState,
+        action: Action,
+        *,
+        collect_all: bool = True
+    ) -> FilterResult:
         """
         Check if an action should be allowed or blocked.
         
+        All rules are evaluated into a bitmask; reasons are reported in order
+        of how often each rule rejects (MEV, latency, volume, EMA, spread).
+        
         Args:
             market_state: Current market state
             action: Proposed action
+            collect_all: Report every failing rule. When False, only the first
+                failing rule's reason and weight are reported.
             
         Returns:
             FilterResult with allowed status and reasons
         """
-        reasons: List[str] = []
-        risk_score = 0.0
+        mev_risk = market_state.mev_risk_score
+        latency_ms = market_state.latency_ms
+        volume_24h = market_state.volume_24h
+        ema_fast = market_state.ema_fast
+        ema_slow = market_state.ema_slow
+        bid = market_state.bid
+        
+        # EMA deviation check (if EMA data available)
+        if ema_fast is not None and ema_slow is not None:
+            ema_avg = (ema_fast + ema_slow) * 0.5
+            deviation = abs(market_state.price - ema_avg)
+            ema_failed = deviation > self._max_ema_dev_frac * ema_avg
+        else:
+            ema_failed = False
+        
+        # Spread/price jump check (simplified using bid-ask spread)
+        spread = market_state.ask - bid
+        
+        # Evaluate every rule into one bitmask; the allowed case is a single compare
+        failed = (
+            (mev_risk > self.max_mev_risk)
+            | ((latency_ms > self.max_latency_ms) << 1)
+            | ((volume_24h < self.min_volume_24h) << 2)
+            | (ema_failed << 3)
+            | ((spread > self._max_price_jump_frac * bid) << 4)
+        )
+        if not failed:
+            return FilterResult(allowed=True, reasons=[], risk_score=0.0)
+        
+        if not collect_all:
+            failed &= -failed  # Keep only the first failing rule
         
-        # MEV risk check
-        if market_state.mev_risk_score > self.max_mev_risk:
+        # Reason strings are only built for rules that failed
+        reasons: List[str] = []
+        if failed & _MEV:
             reasons.append(
-                f"MEV risk too high: {market_state.mev_risk_score:.2f} > {self.max_mev_risk}"
+                f"MEV risk too high: {mev_risk:.2f} > {self.max_mev_risk}"
             )
-            risk_score += 0.3
-        
-        # Latency check
-        if market_state.latency_ms > self.max_latency_ms:
+        if failed & _LATENCY:
             reasons.append(
-                f"Latency too high: {market_state.latency_ms:.0f}ms > {self.max_latency_ms}ms"
+                f"Latency too high: {latency_ms:.0f}ms > {self.max_latency_ms}ms"
             )
-            risk_score += 0.2
-        
-        # Volume check
-        if market_state.volume_24h < self.min_volume_24h:
+        if failed & _VOLUME:
             reasons.append(
-                f"Volume too low: {market_state.volume_24h:.0f} < {self.min_volume_24h}"
+                f"Volume too low: {volume_24h:.0f} < {self.min_volume_24h}"
             )
-            risk_score += 0.2
-        
-        # EMA deviation check (if EMA data available)
-        if market_state.ema_fast is not None and market_state.ema_slow is not None:
-            ema_avg = (market_state.ema_fast + market_state.ema_slow) / 2
-            deviation_pct = abs(market_state.price - ema_avg) / ema_avg * 100
-            
-            if deviation_pct > self.max_ema_deviation_pct:
-                reasons.append(
-                    f"Price deviation from EMA too high: {deviation_pct:.1f}% > {self.max_ema_deviation_pct}%"
-                )
-                risk_score += 0.2
-        
-        # Spread/price jump check (simplified using bid-ask spread)
-        spread_pct = (market_state.ask - market_state.bid) / market_state.bid * 100
-        if spread_pct > self.max_price_jump_pct:
+        if failed & _EMA:
+            deviation_pct = deviation / ema_avg * 100
+            reasons.append(
+                f"Price deviation from EMA too high: {deviation_pct:.1f}% > {self.max_ema_deviation_pct}%"
+            )
+        if failed & _SPREAD:
+            spread_pct = spread / bid * 100
             reasons.append(
                 f"Bid-ask spread too wide: {spread_pct:.2f}% > {self.max_price_jump_pct}%"
             )
-            risk_score += 0.1
-        
-        allowed = len(reasons) == 0
-        risk_score = min(risk_score, 1.0)
         
         return FilterResult(
-            allowed=allowed,
+            allowed=False,
             reasons=reasons,
-            risk_score=risk_score
+            risk_score=_RISK_BY_MASK[failed]
         )
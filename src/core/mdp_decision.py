@@ -4,9 +4,49 @@ MDPDecision: Markov Decision Process with Q-learning.
 Implements a simplified MDP with discrete state/action space and
 Q-learning for action selection.
 """
+from bisect import bisect_right
 import numpy as np
 from typing import Tuple, Optional
-from src.core.types import MarketState, Action, ActionType, MarketRegime
+from src.core.types import (
+    MarketState, MarketFeatures, Action, ActionType, MarketRegime,
+    ACTIONS, ACTION_INDEX, ACTION_COUNT
+)
+
+
+def _greedy_confidence(rows: np.ndarray, best: np.ndarray) -> np.ndarray:
+    """
+    Confidence of the greedy action for one or more Q-table rows.
+    
+    Confidence is higher when the best Q-value clearly beats the row mean:
+    0.5 + 2 * (max - mean), capped at 0.9, or 0.5 when there is no margin.
+    
+    Args:
+        rows: Q-table rows, shape (..., n_actions)
+        best: Greedy action index per row, shape (...)
+        
+    Returns:
+        Confidence per row as float64
+    """
+    max_q = np.take_along_axis(rows, best[..., None], axis=-1)[..., 0].astype(np.float64)
+    avg_q = rows.mean(axis=-1).astype(np.float64)
+    margin = max_q - avg_q
+    return np.where(margin > 0, np.minimum(0.9, 0.5 + margin * 2), 0.5)
+
+
+# Shared default random stream for exploration and replay sampling
+_RNG = np.random.default_rng()
+
+# Upper-exclusive bin edges: low < 0.02 <= medium < 0.05 <= high, etc.
+_VOL_BINS = (0.02, 0.05)
+_LIQ_BINS = (0.4, 0.7)
+
+# Each regime owns a contiguous block of volatility x liquidity states; the
+# block offset is precomputed so discretization is two adds and a multiply
+_N_LIQ_BINS = len(_LIQ_BINS) + 1
+_STATES_PER_REGIME = (len(_VOL_BINS) + 1) * _N_LIQ_BINS
+_REGIME_OFFSET = {
+    regime: i * _STATES_PER_REGIME for i, regime in enumerate(MarketRegime)
+}
 
 
 class MDPDecision:
@@ -23,7 +63,9 @@ class MDPDecision:
         discount_factor: float = 0.95,
         epsilon: float = 0.1,
         epsilon_decay: float = 0.995,
-        min_epsilon: float = 0.01
+        min_epsilon: float = 0.01,
+        replay_capacity: int = 10000,
+        rng: Optional[np.random.Generator] = None
     ):
         """
         Initialize MDP decision layer.
@@ -34,20 +76,42 @@ class MDPDecision:
             epsilon: Exploration rate for epsilon-greedy
             epsilon_decay: Decay rate for epsilon
             min_epsilon: Minimum epsilon value
+            replay_capacity: Number of transitions kept for experience replay
+            rng: Random generator (defaults to a shared module-level one;
+                pass a seeded generator for reproducible runs)
         """
         self.learning_rate = learning_rate
         self.discount_factor = discount_factor
         self.epsilon = epsilon
         self.epsilon_decay = epsilon_decay
         self.min_epsilon = min_epsilon
+        self._rng = rng if rng is not None else _RNG
         
-        # Q-table: state_idx -> action -> value
-        self.q_table: dict[int, dict[ActionType, float]] = {}
+        # Q-table: dense (state_idx, action_idx) array over the full
+        # 5 regimes * 3 volatility * 3 liquidity = 45 state space
+        self.n_states = len(MarketRegime) * _STATES_PER_REGIME
+        self.q_table = np.zeros((self.n_states, ACTION_COUNT), dtype=np.float32)
+        # Greedy action and its confidence per state, refreshed only when
+        # that state's row changes so the greedy path is two array reads
+        self.best_action = np.zeros(self.n_states, dtype=np.int8)
+        self.greedy_confidence = np.full(self.n_states, 0.5)
+        # States seen by select_action/update/replay; the dense table has a
+        # row for every state, so monitoring counts this mask instead
+        self.visited = np.zeros(self.n_states, dtype=bool)
+        
+        # Experience replay ring buffer, one array per transition field
+        self.replay_capacity = replay_capacity
+        self.buf_s = np.empty(replay_capacity, dtype=np.int32)
+        self.buf_a = np.empty(replay_capacity, dtype=np.int32)
+        self.buf_r = np.empty(replay_capacity, dtype=np.float32)
+        self.buf_ns = np.empty(replay_capacity, dtype=np.int32)
+        self.buf_d = np.empty(replay_capacity, dtype=np.float32)
+        self.write_idx = 0
         
         # Episode counter
         self.episode_count = 0
     
-    def _discretize_state(self, market_state: MarketState) -> int:
+    def _discretize_state(self, market_state: MarketFeatures) -> int:
         """
         Discretize continuous market state to integer state index.
         
@@ -59,44 +123,19 @@ class MDPDecision:
         Returns:
             Integer state index
         """
-        # Regime: 5 states
-        regime_idx = list(MarketRegime).index(market_state.regime)
-        
         # Volatility: 3 bins (low, medium, high)
-        if market_state.volatility < 0.02:
-            vol_idx = 0
-        elif market_state.volatility < 0.05:
-            vol_idx = 1
-        else:
-            vol_idx = 2
+        vol_idx = bisect_right(_VOL_BINS, market_state.volatility)
         
         # Liquidity: 3 bins (low, medium, high)
-        if market_state.liquidity_score < 0.4:
-            liq_idx = 0
-        elif market_state.liquidity_score < 0.7:
-            liq_idx = 1
-        else:
-            liq_idx = 2
+        liq_idx = bisect_right(_LIQ_BINS, market_state.liquidity_score)
         
         # Combine into single state index
         # 5 regimes * 3 volatility * 3 liquidity = 45 states
-        state_idx = regime_idx * 9 + vol_idx * 3 + liq_idx
-        
-        return state_idx
-    
-    def _init_state(self, state_idx: int):
-        """Initialize Q-values for a new state."""
-        if state_idx not in self.q_table:
-            self.q_table[state_idx] = {
-                ActionType.BUY: 0.0,
-                ActionType.SELL: 0.0,
-                ActionType.HOLD: 0.0,
-                ActionType.CLOSE: 0.0
-            }
+        return _REGIME_OFFSET[market_state.regime] + vol_idx * _N_LIQ_BINS + liq_idx
     
     def select_action(
         self,
-        market_state: MarketState,
+        market_state: MarketFeatures,
         explore: bool = True
     ) -> Tuple[ActionType, float]:
         """
@@ -110,37 +149,26 @@ class MDPDecision:
             Tuple of (action_type, confidence)
         """
         state_idx = self._discretize_state(market_state)
-        self._init_state(state_idx)
+        self.visited[state_idx] = True
         
         # Epsilon-greedy exploration
-        if explore and np.random.random() < self.epsilon:
+        if explore and self._rng.random() < self.epsilon:
             # Random action
-            import random
-            action_type = random.choice(list(ActionType))
+            action_type = ACTIONS[self._rng.integers(ACTION_COUNT)]
             confidence = 0.3  # Low confidence for random actions
         else:
-            # Greedy action (highest Q-value)
-            q_values = self.q_table[state_idx]
-            action_type = max(q_values, key=q_values.get)
-            
-            # Confidence based on Q-value and spread
-            max_q = q_values[action_type]
-            avg_q = np.mean(list(q_values.values()))
-            
-            # Confidence higher when Q-value is clearly better
-            if max_q > avg_q:
-                confidence = min(0.9, 0.5 + (max_q - avg_q) * 2)
-            else:
-                confidence = 0.5
+            # Greedy action (highest Q-value) with its cached confidence
+            action_type = ACTIONS[self.best_action[state_idx]]
+            confidence = float(self.greedy_confidence[state_idx])
         
         return action_type, confidence
     
     def update(
         self,
-        state: MarketState,
+        state: MarketFeatures,
         action: ActionType,
         reward: float,
-        next_state: MarketState,
+        next_state: MarketFeatures,
         done: bool = False
     ):
         """
@@ -155,20 +183,22 @@ class MDPDecision:
         """
         state_idx = self._discretize_state(state)
         next_state_idx = self._discretize_state(next_state)
-        
-        self._init_state(state_idx)
-        self._init_state(next_state_idx)
+        action_idx = ACTION_INDEX[action]
+        self.visited[state_idx] = True
+        self.visited[next_state_idx] = True
         
         # Q-learning update: Q(s,a) += α * (r + γ * max_a' Q(s',a') - Q(s,a))
-        current_q = self.q_table[state_idx][action]
+        current_q = float(self.q_table[state_idx, action_idx])
         
-        if done:
-            target = reward
-        else:
-            max_next_q = max(self.q_table[next_state_idx].values())
-            target = reward + self.discount_factor * max_next_q
+        # Terminal transitions drop the bootstrap term via a 0/1 mask, the
+        # same (1 - done) form replay() applies across a minibatch
+        mask = 0.0 if done else 1.0
+        # best_action is kept in step with the table, so max is a single read
+        max_next_q = float(self.q_table[next_state_idx, self.best_action[next_state_idx]])
+        target = reward + self.discount_factor * max_next_q * mask
         
-        self.q_table[state_idx][action] += self.learning_rate * (target - current_q)
+        self.q_table[state_idx, action_idx] += self.learning_rate * (target - current_q)
+        self._refresh_greedy(state_idx)
         
         # Decay epsilon
         if done:
@@ -178,10 +208,134 @@ class MDPDecision:
                 self.epsilon * self.epsilon_decay
             )
     
+    def remember(
+        self,
+        state: MarketFeatures,
+        action: ActionType,
+        reward: float,
+        next_state: MarketFeatures,
+        done: bool = False
+    ):
+        """
+        Store a transition in the replay buffer, overwriting the oldest when full.
+        
+        Args:
+            state: Previous state
+            action: Action taken
+            reward: Reward received
+            next_state: New state after action
+            done: Whether episode ended
+        """
+        slot = self.write_idx % self.replay_capacity
+        self.buf_s[slot] = self._discretize_state(state)
+        self.buf_a[slot] = ACTION_INDEX[action]
+        self.buf_r[slot] = reward
+        self.buf_ns[slot] = self._discretize_state(next_state)
+        self.buf_d[slot] = 1.0 if done else 0.0
+        self.write_idx += 1
+    
+    def replay(self, batch_size: int = 32) -> int:
+        """
+        Apply one vectorized Q-learning update over a random minibatch.
+        
+        Args:
+            batch_size: Number of transitions to sample (with replacement)
+            
+        Returns:
+            Number of transitions applied (0 if the buffer is empty)
+        """
+        size = min(self.write_idx, self.replay_capacity)
+        if size == 0:
+            return 0
+        
+        idx = self._rng.integers(0, size, batch_size)
+        s = self.buf_s[idx]
+        a = self.buf_a[idx]
+        
+        ns = self.buf_ns[idx]
+        self.visited[s] = True
+        self.visited[ns] = True
+        max_next_q = self.q_table[ns, self.best_action[ns]]
+        target = self.buf_r[idx] + self.discount_factor * max_next_q * (1.0 - self.buf_d[idx])
+        
+        td_error = target - self.q_table[s, a]
+        
+        # Average TD errors per (s, a) so pairs sampled several times in one
+        # batch take a single step instead of overshooting the target
+        flat = s * self.q_table.shape[1] + a
+        sums = np.bincount(flat, weights=td_error, minlength=self.q_table.size)
+        counts = np.bincount(flat, minlength=self.q_table.size)
+        hit = counts > 0
+        q_flat = self.q_table.reshape(-1)
+        q_flat[hit] += self.learning_rate * (sums[hit] / counts[hit])
+        
+        self._refresh_greedy(np.unique(s))
+        return batch_size
+    
+    def save(self, path: str):
+        """
+        Persist the Q-table and exploration state as a compressed .npz file.
+        
+        Args:
+            path: Destination file path (NumPy appends .npz if missing)
+        """
+        np.savez_compressed(
+            path,
+            q=self.q_table,
+            visited=self.visited,
+            epsilon=self.epsilon,
+            episode_count=self.episode_count
+        )
+    
+    def load(self, path: str):
+        """
+        Restore the Q-table and exploration state written by save().
+        
+        Args:
+            path: Path to the .npz file
+            
+        Raises:
+            ValueError: If the stored Q-table or visited-mask shape doesn't
+                match this instance
+        """
+        with np.load(path) as data:
+            q_table = data["q"]
+            if q_table.shape != self.q_table.shape:
+                raise ValueError(
+                    f"Q-table shape {q_table.shape} does not match {self.q_table.shape}"
+                )
+            if "visited" in data.files:
+                visited = data["visited"]
+                if visited.shape != (self.n_states,):
+                    raise ValueError(
+                        f"Visited mask shape {visited.shape} does not match ({self.n_states},)"
+                    )
+                visited = visited.astype(bool)
+            else:
+                # Files without the mask: any row that has been updated
+                visited = (q_table != 0).any(axis=1)
+            self.q_table = q_table.astype(np.float32)
+            self.visited = visited
+            self.epsilon = float(data["epsilon"])
+            self.episode_count = int(data["episode_count"])
+        self._refresh_greedy(slice(None))
+    
+    def _refresh_greedy(self, states):
+        """
+        Recompute cached greedy actions and confidences after Q-values change.
+        
+        Args:
+            states: State index, index array or slice of rows to refresh
+        """
+        rows = self.q_table[states]
+        best = rows.argmax(axis=-1)
+        self.best_action[states] = best
+        self.greedy_confidence[states] = _greedy_confidence(rows, best)
+    
     def get_state(self) -> dict:
         """Get current engine state for monitoring."""
         return {
             "episode_count": self.episode_count,
             "epsilon": self.epsilon,
-            "q_table_size": len(self.q_table)
+            "q_table_size": int(np.count_nonzero(self.visited))
         }
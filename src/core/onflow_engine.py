@@ -4,9 +4,9 @@ OnflowEngine: Gradient-based allocation engine using Kelly-like criterion.
 Implements an exponentially weighted moving average (EWMA) estimate of
 returns and suggests allocation fractions for position sizing.
 """
-import numpy as np
-from typing import Optional
-from src.core.types import MarketState, Action, ActionType
+from typing import Optional, Tuple
+from src.core.types import MarketState, MarketFeatures, Action, ActionType
+from src.core._onflow_kernels import ewma_update, kelly_allocation
 
 
 class OnflowEngine:
@@ -39,12 +39,36 @@ class OnflowEngine:
         self.min_allocation = min_allocation
         self.kelly_fraction = kelly_fraction
         
-        # EWMA state
-        self.ewma_win_rate: Optional[float] = None
-        self.ewma_avg_return: Optional[float] = None
-        self.ewma_volatility: Optional[float] = None
+        # EWMA state: (win_rate, avg_return, volatility), None until the first trade
+        self._ewma: Optional[Tuple[float, float, float]] = None
         self.trade_count = 0
     
+    @property
+    def ewma_alpha(self) -> float:
+        """EWMA smoothing factor."""
+        return self._ewma_alpha
+    
+    @ewma_alpha.setter
+    def ewma_alpha(self, value: float):
+        # Keep the complement in step so update() only multiplies
+        self._ewma_alpha = value
+        self._one_minus_alpha = 1.0 - value
+    
+    @property
+    def ewma_win_rate(self) -> Optional[float]:
+        """EWMA of the win rate, or None before any trade."""
+        return None if self._ewma is None else self._ewma[0]
+    
+    @property
+    def ewma_avg_return(self) -> Optional[float]:
+        """EWMA of the trade return percentage, or None before any trade."""
+        return None if self._ewma is None else self._ewma[1]
+    
+    @property
+    def ewma_volatility(self) -> Optional[float]:
+        """EWMA of market volatility at trade time, or None before any trade."""
+        return None if self._ewma is None else self._ewma[2]
+    
     def update(self, won: bool, return_pct: float, volatility: float = 0.0):
         """
         Update EWMA estimates with new trade result.
@@ -56,35 +80,24 @@ class OnflowEngine:
         """
         self.trade_count += 1
         
-        # Update win rate
         win_value = 1.0 if won else 0.0
-        if self.ewma_win_rate is None:
-            self.ewma_win_rate = win_value
+        ewma = self._ewma
+        if ewma is None:
+            # First trade seeds all three estimates
+            self._ewma = (win_value, return_pct, volatility)
         else:
-            self.ewma_win_rate = (
-                self.ewma_alpha * win_value +
-                (1 - self.ewma_alpha) * self.ewma_win_rate
-            )
-        
-        # Update average return
-        if self.ewma_avg_return is None:
-            self.ewma_avg_return = return_pct
-        else:
-            self.ewma_avg_return = (
-                self.ewma_alpha * return_pct +
-                (1 - self.ewma_alpha) * self.ewma_avg_return
-            )
-        
-        # Update volatility estimate
-        if self.ewma_volatility is None:
-            self.ewma_volatility = volatility
-        else:
-            self.ewma_volatility = (
-                self.ewma_alpha * volatility +
-                (1 - self.ewma_alpha) * self.ewma_volatility
+            self._ewma = ewma_update(
+                ewma[0],
+                ewma[1],
+                ewma[2],
+                self._ewma_alpha,
+                self._one_minus_alpha,
+                win_value,
+                return_pct,
+                volatility
             )
     
-    def suggest_allocation(self, market_state: MarketState) -> float:
+    def suggest_allocation(self, market_state: MarketFeatures) -> float:
         """
         Suggest allocation fraction based on Kelly-like criterion.
         
@@ -95,41 +108,24 @@ class OnflowEngine:
             Allocation fraction (0-1)
         """
         # If no history, use conservative allocation
-        if self.ewma_win_rate is None or self.ewma_avg_return is None:
+        ewma = self._ewma
+        if ewma is None:
             return self.min_allocation
         
         # Kelly formula: f = (p * b - q) / b
         # where p = win rate, q = 1 - p, b = avg_win / avg_loss ratio
         # Simplified: f ≈ edge / variance
-        
-        p = self.ewma_win_rate
-        q = 1 - p
-        
-        # Estimate edge
-        edge = self.ewma_avg_return / 100.0  # Convert percentage to fraction
-        
-        # Use volatility as risk measure
-        volatility = market_state.volatility if market_state.volatility > 0 else 0.1
-        if self.ewma_volatility and self.ewma_volatility > 0:
-            volatility = (volatility + self.ewma_volatility) / 2
-        
-        # Compute Kelly fraction
-        # f = edge / (volatility^2)
-        if volatility > 0:
-            kelly_f = edge / (volatility ** 2)
-        else:
-            kelly_f = self.min_allocation
-        
-        # Apply Kelly fraction multiplier for safety
-        kelly_f *= self.kelly_fraction
-        
-        # Adjust for win rate (boost if winning consistently)
-        kelly_f *= (0.5 + p * 0.5)
+        kelly_f = kelly_allocation(
+            ewma[0],
+            ewma[1],
+            ewma[2],
+            market_state.volatility,
+            self.kelly_fraction,
+            self.min_allocation
+        )
         
         # Clamp to bounds
-        allocation = np.clip(kelly_f, self.min_allocation, self.max_allocation)
-        
-        return float(allocation)
+        return min(self.max_allocation, max(self.min_allocation, kelly_f))
     
     def get_state(self) -> dict:
         """Get current engine state for monitoring."""
@@ -3,10 +3,12 @@ Core type definitions and Pydantic models for the Hyper-Accumulation Bot v3.0.
 
 This module defines all shared types, enums, and data models used throughout the system.
 """
+import time
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Protocol
 from pydantic import BaseModel, Field, ConfigDict
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 
 class ActionType(str, Enum):
@@ -17,6 +19,13 @@ class ActionType(str, Enum):
     CLOSE = "close"
 
 
+# Canonical action order shared by array-backed engines (Q-table columns,
+# vote accumulators); index i in any action-indexed array is ACTIONS[i]
+ACTIONS: Tuple[ActionType, ...] = tuple(ActionType)
+ACTION_INDEX: Dict[ActionType, int] = {action: i for i, action in enumerate(ACTIONS)}
+ACTION_COUNT: int = len(ACTIONS)
+
+
 class MarketRegime(str, Enum):
     """Market regime classification."""
     TRENDING_UP = "trending_up"
@@ -56,6 +65,28 @@ class MarketState(BaseModel):
     liquidity_score: float = Field(ge=0, le=1, default=1.0)
     mev_risk_score: float = Field(ge=0, le=1, default=0.0)
     latency_ms: float = Field(ge=0, default=0.0)
+    
+    @classmethod
+    def fast_build(cls, **kwargs: Any) -> "MarketState":
+        """
+        Build without validation, for trusted internally generated data.
+        
+        Untrusted input (API responses, user data) should go through the
+        normal constructor so the field constraints are enforced.
+        
+        Args:
+            **kwargs: Field values, already of the declared types
+            
+        Returns:
+            Unvalidated MarketState
+        """
+        return cls.model_construct(**kwargs)
+    
+    def to_fast(self) -> "MarketStateFast":
+        """Copy into an unvalidated slotted dataclass for internal hot paths."""
+        fields = dict(self.__dict__)
+        timestamp = fields.pop("timestamp")
+        return MarketStateFast(timestamp_ns=_datetime_to_ns(timestamp), **fields)
 
 
 class Action(BaseModel):
@@ -63,7 +94,11 @@ class Action(BaseModel):
     An action to be taken by the bot.
     
     Represents a specific trade action with sizing and metadata.
+    Frozen so one instance can be shared across stages without
+    defensive copies; derive changed actions with model_copy(update=...).
     """
+    model_config = ConfigDict(frozen=True)
+    
     action_type: ActionType
     size: float = Field(ge=0)
     price: Optional[float] = None
@@ -71,8 +106,30 @@ class Action(BaseModel):
     leverage: float = Field(ge=1, le=5, default=1.0)
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
+    @property
+    def is_buy(self) -> bool:
+        """Whether this action fills on the buy side (enum identity check)."""
+        return self.action_type is ActionType.BUY
+    
     def __str__(self) -> str:
         return f"Action({self.action_type.value}, size={self.size:.4f}, conf={self.confidence:.2f})"
+    
+    @classmethod
+    def fast_build(cls, **kwargs: Any) -> "Action":
+        """
+        Build without validation, for trusted internally generated data.
+        
+        Args:
+            **kwargs: Field values, already of the declared types
+            
+        Returns:
+            Unvalidated Action
+        """
+        return cls.model_construct(**kwargs)
+    
+    def to_fast(self) -> "ActionFast":
+        """Copy into an unvalidated slotted dataclass for internal hot paths."""
+        return ActionFast(**self.__dict__)
 
 
 class Decision(BaseModel):
@@ -121,3 +178,102 @@ class EngineVote(BaseModel):
     action: Action
     confidence: float = Field(ge=0, le=1)
     metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+@dataclass(slots=True, frozen=True)
+class Quote:
+    """
+    A trade quote from a quote client.
+    
+    Slotted and immutable: quotes are created on every request and may be
+    shared through client-side caches.
+    """
+    price: float
+    slippage_pct: float
+    fees_usd: float
+    estimated_fill: float
+    route_plan: Tuple[Any, ...] = ()
+    raw_quote: Optional[Dict[str, Any]] = None
+    is_fallback: bool = False
+
+
+class MarketFeatures(Protocol):
+    """
+    Market fields read by the decision and execution engines.
+    
+    Satisfied by both MarketState and MarketStateFast, so hot paths can
+    pass the slotted copy without converting back to the Pydantic model.
+    """
+    price: float
+    regime: MarketRegime
+    volatility: float
+    liquidity_score: float
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _datetime_to_ns(value: datetime) -> int:
+    """
+    Convert a datetime to integer epoch nanoseconds without float rounding.
+    
+    Args:
+        value: Datetime to convert (naive values are taken as UTC)
+        
+    Returns:
+        Nanoseconds since the Unix epoch
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class MarketStateFast:
+    """
+    Slotted, unvalidated counterpart of MarketState.
+    
+    Validation happens once at the ingestion boundary (MarketState);
+    internal propagation can use this cheaper copy via MarketState.to_fast().
+    """
+    # Integer epoch nanoseconds: cheap to create and compare in-process;
+    # converted to a datetime only when read through .timestamp
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    symbol: str = "SOL/USD"
+    price: float
+    volume_24h: float
+    bid: float
+    ask: float
+    ema_fast: Optional[float] = None
+    ema_slow: Optional[float] = None
+    regime: MarketRegime = MarketRegime.UNKNOWN
+    volatility: float = 0.0
+    liquidity_score: float = 1.0
+    mev_risk_score: float = 0.0
+    latency_ms: float = 0.0
+    
+    @property
+    def timestamp(self) -> datetime:
+        """UTC datetime view of timestamp_ns, for output boundaries."""
+        return _EPOCH + timedelta(microseconds=self.timestamp_ns // 1000)
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ActionFast:
+    """
+    Slotted, unvalidated counterpart of Action.
+    
+    Created via Action.to_fast() once an action has been validated.
+    """
+    action_type: ActionType
+    size: float
+    price: Optional[float] = None
+    confidence: float
+    leverage: float = 1.0
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    @property
+    def is_buy(self) -> bool:
+        """Whether this action fills on the buy side (enum identity check)."""
+        return self.action_type is ActionType.BUY
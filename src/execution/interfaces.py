@@ -3,8 +3,8 @@ Protocol interfaces for execution and market data.
 
 Defines abstract interfaces that all adapters must implement.
 """
-from typing import Protocol, Optional, Dict, Any
-from src.core.types import MarketState, Action
+from typing import Protocol, Optional, Dict, Any, List, Tuple, Union
+from src.core.types import MarketState, Action, Quote
 
 
 class MarketDataFetcher(Protocol):
@@ -39,7 +39,7 @@ class QuoteClient(Protocol):
         symbol: str,
         size_notional: float,
         side: str
-    ) -> Dict[str, Any]:
+    ) -> Quote:
         """
         Get a quote for a trade.
         
@@ -49,7 +49,57 @@ class QuoteClient(Protocol):
             side: "buy" or "sell"
             
         Returns:
-            Quote dictionary with price, slippage, fees
+            Quote with price, slippage, fees
+        """
+        ...
+
+
+class BatchQuoteClient(QuoteClient, Protocol):
+    """
+    Quote client that can price several sizes of one trade in a single call.
+    """
+    
+    async def get_quotes_batch(
+        self,
+        symbol: str,
+        sizes: List[float],
+        side: str
+    ) -> List[Union[Quote, BaseException]]:
+        """
+        Get quotes for several sizes of the same trade.
+        
+        Args:
+            symbol: Trading pair symbol
+            sizes: Sizes in notional currency (e.g., USD)
+            side: "buy" or "sell"
+            
+        Returns:
+            Quotes in size order; a failed request yields its exception
+        """
+        ...
+
+
+class TryQuoteClient(QuoteClient, Protocol):
+    """
+    Quote client that reports failures as values instead of raising.
+    """
+    
+    async def try_get_quote(
+        self,
+        symbol: str,
+        size_notional: float,
+        side: str
+    ) -> Tuple[bool, Union[Quote, str]]:
+        """
+        Get a quote for a trade without raising on failure.
+        
+        Args:
+            symbol: Trading pair symbol
+            size_notional: Size in notional currency (e.g., USD)
+            side: "buy" or "sell"
+            
+        Returns:
+            (True, quote) on success, (False, error message) on failure
         """
         ...
 
@@ -4,9 +4,15 @@ JitoWarpExecutor: Simulated Jito bundle submission.
 Models bundle submission with latency and fee structure for Jito MEV protection.
 """
 import asyncio
-import random
-from typing import Dict, Any
-from src.core.types import Action, MarketState
+import numpy as np
+from typing import Dict, Any, Optional
+from src.core.types import Action, MarketFeatures
+
+# Base network fee per transaction: 5000 lamports
+_NETWORK_FEE_SOL = 0.000005
+
+# Samples drawn per refill of the executor's random ring
+_RING_SIZE = 1 << 16
 
 
 class JitoWarpExecutor:
@@ -22,7 +28,10 @@ class JitoWarpExecutor:
         base_latency_ms: float = 150.0,
         latency_variance_ms: float = 50.0,
         jito_tip_lamports: float = 10000.0,
-        slippage_factor: float = 0.001
+        slippage_factor: float = 0.001,
+        inclusion_probability: float = 0.95,
+        seed: Optional[int] = None,
+        simulate_wallclock: bool = False
     ):
         """
         Initialize Jito executor.
@@ -32,16 +41,59 @@ class JitoWarpExecutor:
             latency_variance_ms: Variance in latency
             jito_tip_lamports: Tip amount for Jito validators
             slippage_factor: Base slippage factor
+            inclusion_probability: Chance a bundle lands in a block
+            seed: Optional seed for reproducible simulations
+            simulate_wallclock: Actually sleep for the simulated latency;
+                when False latency is only reported, so replays run at
+                compute speed
         """
         self.base_latency_ms = base_latency_ms
         self.latency_variance_ms = latency_variance_ms
         self.jito_tip_lamports = jito_tip_lamports
         self.slippage_factor = slippage_factor
+        self.inclusion_probability = inclusion_probability
+        self.simulate_wallclock = simulate_wallclock
+        
+        # Simulated bundle ids: sequential, so unique per executor
+        self._tx_counter = 0
+        
+        # Latency noise and inclusion uniforms are drawn in bulk and read
+        # one slot per bundle instead of a random call per draw; inclusion
+        # compares against the live probability so changes apply at once
+        self._rng = np.random.default_rng(seed)
+        self._refill()
+    
+    @property
+    def jito_tip_lamports(self) -> float:
+        """Tip amount for Jito validators, in lamports."""
+        return self._jito_tip_lamports
+    
+    @jito_tip_lamports.setter
+    def jito_tip_lamports(self, value: float):
+        # Keep the SOL-denominated fees in step so each bundle only multiplies
+        self._jito_tip_lamports = value
+        self._jito_tip_sol = value / 1e9
+        self._fees_sol = self._jito_tip_sol + _NETWORK_FEE_SOL
+    
+    def _refill(self):
+        """Draw a fresh block of per-bundle random samples."""
+        rng = self._rng
+        self._gauss = rng.standard_normal(_RING_SIZE).tolist()
+        self._uniform = rng.random(_RING_SIZE).tolist()
+        self._idx = 0
+    
+    def _next_slot(self) -> int:
+        """Claim the next sample slot, refilling when the block is used up."""
+        if self._idx >= _RING_SIZE:
+            self._refill()
+        i = self._idx
+        self._idx = i + 1
+        return i
     
     async def execute_bundle(
         self,
         action: Action,
-        market_state: MarketState
+        market_state: MarketFeatures
     ) -> Dict[str, Any]:
         """
         Simulate bundle submission and execution.
@@ -53,10 +105,13 @@ class JitoWarpExecutor:
         Returns:
             Execution report
         """
+        i = self._next_slot()
+        
         # Simulate network latency
-        latency_ms = self.base_latency_ms + random.gauss(0, self.latency_variance_ms)
+        latency_ms = self.base_latency_ms + self._gauss[i] * self.latency_variance_ms
         latency_ms = max(50.0, latency_ms)
-        await asyncio.sleep(latency_ms / 1000.0)
+        if self.simulate_wallclock:
+            await asyncio.sleep(latency_ms / 1000.0)
         
         # Calculate slippage based on size and liquidity
         size_impact = action.size / 10000.0  # Normalize
@@ -64,19 +119,19 @@ class JitoWarpExecutor:
         slippage_pct = self.slippage_factor * size_impact * liquidity_factor * 100
         
         # Apply slippage to price
-        if action.action_type.value in ["buy", "long"]:
+        if action.is_buy:
             fill_price = market_state.price * (1 + slippage_pct / 100)
         else:
             fill_price = market_state.price * (1 - slippage_pct / 100)
         
         # Calculate fees
         sol_to_usd = market_state.price  # Simplified
-        jito_tip_usd = (self.jito_tip_lamports / 1e9) * sol_to_usd
-        network_fee_usd = 0.000005 * sol_to_usd  # 5000 lamports
+        jito_tip_usd = self._jito_tip_sol * sol_to_usd
+        network_fee_usd = _NETWORK_FEE_SOL * sol_to_usd
         total_fees = jito_tip_usd + network_fee_usd
         
-        # Simulate bundle success (95% success rate)
-        success = random.random() < 0.95
+        # Simulate bundle success
+        success = self._uniform[i] < self.inclusion_probability
         
         if not success:
             return {
@@ -86,6 +141,7 @@ class JitoWarpExecutor:
                 "jito_tip_usd": jito_tip_usd
             }
         
+        self._tx_counter += 1
         return {
             "success": True,
             "action": action.action_type.value,
@@ -98,13 +154,68 @@ class JitoWarpExecutor:
             "jito_tip_usd": jito_tip_usd,
             "network_fee_usd": network_fee_usd,
             "total_fees_usd": total_fees,
-            "bundle_hash": f"jito_bundle_{random.randint(1000000, 9999999)}"
+            "bundle_hash": f"jito_bundle_{self._tx_counter:x}"
+        }
+    
+    def execute_many(
+        self,
+        is_buy: np.ndarray,
+        sizes: np.ndarray,
+        prices: np.ndarray,
+        liquidity_scores: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Simulate a batch of bundles at once, without wall-clock latency.
+        
+        Applies the same latency, slippage, fee and inclusion model as
+        execute_bundle, over column arrays instead of one bundle per call.
+        Intended for backtests that replay many bundles.
+        
+        Args:
+            is_buy: Boolean side per bundle (True for buy)
+            sizes: Action size per bundle
+            prices: Market price per bundle
+            liquidity_scores: Market liquidity score per bundle
+            
+        Returns:
+            Dict of per-bundle arrays: success, latency_ms, fill_price,
+            slippage_pct, jito_tip_usd, network_fee_usd, total_fees_usd
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        n = prices.shape[0]
+        rng = self._rng
+        
+        latency_ms = np.maximum(
+            50.0,
+            self.base_latency_ms + rng.standard_normal(n) * self.latency_variance_ms
+        )
+        
+        slippage_pct = (
+            self.slippage_factor
+            * (np.asarray(sizes, dtype=np.float64) / 10000.0)
+            / np.asarray(liquidity_scores, dtype=np.float64)
+            * 100
+        )
+        direction = np.where(is_buy, 1.0, -1.0)
+        fill_price = prices * (1 + direction * slippage_pct / 100)
+        
+        jito_tip_usd = self._jito_tip_sol * prices
+        network_fee_usd = _NETWORK_FEE_SOL * prices
+        
+        return {
+            "success": rng.random(n) < self.inclusion_probability,
+            "latency_ms": latency_ms,
+            "fill_price": fill_price,
+            "slippage_pct": slippage_pct,
+            "jito_tip_usd": jito_tip_usd,
+            "network_fee_usd": network_fee_usd,
+            "total_fees_usd": self._fees_sol * prices
         }
     
     async def execute_action(
         self,
         action: Action,
-        market_state: MarketState
+        market_state: MarketFeatures
     ) -> Dict[str, Any]:
         """
         Execute an action via Jito bundle.
@@ -3,14 +3,18 @@ LeverageEngine: Position sizing and leverage management.
 
 Implements Kelly-like sizing with maximum leverage and position limits.
 """
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
-from src.core.types import Action, MarketState
+from typing import Dict, Any, Optional, Tuple
+import numpy as np
+from src.core.types import Action, MarketFeatures
+from src.execution._sizing_kernels import size_position, size_positions
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LeverageConfig:
-    """Configuration for leverage engine."""
+    """Configuration for leverage engine (immutable; build a new one to change limits)."""
     max_leverage: float = 5.0
     max_position_pct: float = 0.35
     min_position_pct: float = 0.01
@@ -26,19 +30,31 @@ class LeverageEngine:
     account balance, and risk limits.
     """
     
-    def __init__(self, config: Optional[LeverageConfig] = None):
+    def __init__(
+        self,
+        config: Optional[LeverageConfig] = None,
+        margin_ttl_sec: float = 2.0,
+        margin_cache_size: int = 1024
+    ):
         """
         Initialize leverage engine.
         
         Args:
             config: Leverage configuration
+            margin_ttl_sec: How long a margin response may be reused
+            margin_cache_size: Maximum number of cached margin responses (LRU)
         """
         self.config = config or LeverageConfig()
+        
+        # Short-lived margin cache: key -> (monotonic timestamp, response)
+        self._margin_cache: "OrderedDict[tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._margin_ttl_sec = margin_ttl_sec
+        self._margin_cache_size = margin_cache_size
     
     def size_position(
         self,
         action: Action,
-        market_state: MarketState,
+        market_state: MarketFeatures,
         account_balance: Optional[float] = None
     ) -> Action:
         """
@@ -50,45 +66,63 @@ class LeverageEngine:
             account_balance: Current account balance (overrides config)
             
         Returns:
-            Action with updated size and leverage
+            New Action with updated size, leverage and price
         """
         balance = account_balance or self.config.account_balance
+        config = self.config
         
-        # Base allocation on confidence
-        # Higher confidence -> larger position
-        allocation_pct = action.confidence * self.config.max_position_pct
-        allocation_pct = max(self.config.min_position_pct, allocation_pct)
-        
-        # Adjust for market liquidity
-        allocation_pct *= market_state.liquidity_score
-        
-        # Reduce for high volatility
-        if market_state.volatility > 0.05:
-            allocation_pct *= 0.7
-        
-        # Clamp to limits
-        allocation_pct = min(allocation_pct, self.config.max_position_pct)
-        
-        # Calculate position size
-        position_size = balance * allocation_pct
+        position_size, leverage, allocation_pct = size_position(
+            action.confidence,
+            market_state.volatility,
+            market_state.liquidity_score,
+            balance,
+            config.max_position_pct,
+            config.min_position_pct,
+            config.max_leverage
+        )
         
-        # Determine leverage
-        # Higher confidence allows more leverage
-        base_leverage = 1.0 + (action.confidence * (self.config.max_leverage - 1.0))
-        leverage = min(base_leverage, self.config.max_leverage)
-        
-        # Reduce leverage in volatile markets
-        if market_state.volatility > 0.05:
-            leverage = max(1.0, leverage * 0.6)
-        
-        # Update action
-        action.size = position_size
-        action.leverage = leverage
-        action.price = market_state.price
-        action.metadata["allocation_pct"] = allocation_pct
-        action.metadata["account_balance"] = balance
+        # Derive the sized action; the input is left untouched
+        return action.model_copy(update={
+            "size": position_size,
+            "leverage": leverage,
+            "price": market_state.price,
+            "metadata": {
+                **action.metadata,
+                "allocation_pct": allocation_pct,
+                "account_balance": balance
+            }
+        })
+    
+    def size_positions_batch(
+        self,
+        confidences: np.ndarray,
+        volatilities: np.ndarray,
+        liquidity_scores: np.ndarray,
+        account_balance: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Size many candidate positions at once with the size_position rules.
         
-        return action
+        Args:
+            confidences: Confidence per candidate
+            volatilities: Market volatility per candidate
+            liquidity_scores: Market liquidity score per candidate
+            account_balance: Current account balance (overrides config)
+            
+        Returns:
+            Tuple of (sizes, leverages, allocation_pcts) arrays
+        """
+        balance = account_balance or self.config.account_balance
+        config = self.config
+        return size_positions(
+            np.asarray(confidences, dtype=np.float64),
+            np.asarray(volatilities, dtype=np.float64),
+            np.asarray(liquidity_scores, dtype=np.float64),
+            balance,
+            config.max_position_pct,
+            config.min_position_pct,
+            config.max_leverage
+        )
     
     async def request_margin(
         self,
@@ -109,12 +143,26 @@ class LeverageEngine:
         Returns:
             Margin response
         """
+        # Serve retries within one decision window from the cache
+        cache_key = (
+            round(size, 4),
+            round(leverage, 2),
+            None if collateral is None else round(collateral, 4)
+        )
+        cached = self._margin_cache.get(cache_key)
+        if cached is not None:
+            cached_at, cached_response = cached
+            if time.monotonic() - cached_at < self._margin_ttl_sec:
+                self._margin_cache.move_to_end(cache_key)
+                return dict(cached_response)
+            del self._margin_cache[cache_key]
+        
         # Calculate required collateral
         if collateral is None:
             collateral = size / leverage
         
         # Simple approval for simulation
-        return {
+        response = {
             "approved": True,
             "size": size,
             "leverage": leverage,
@@ -122,3 +170,12 @@ class LeverageEngine:
             "interest_rate": 0.0001,  # 0.01% per trade
             "provider": "stub"
         }
+        
+        self._margin_cache[cache_key] = (time.monotonic(), response)
+        while len(self._margin_cache) > self._margin_cache_size:
+            self._margin_cache.popitem(last=False)
+        return dict(response)
+    
+    def invalidate_margin_cache(self):
+        """Drop cached margin responses, e.g. after the account balance changes."""
+        self._margin_cache.clear()
@@ -5,10 +5,36 @@ Slices large orders into smaller chunks and executes them over time
 to minimize market impact and slippage.
 """
 import asyncio
-from typing import Dict, Any, List
-from src.core.types import Action, MarketState
+import functools
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, Union
+import numpy as np
+from src.core.types import Action, MarketState, Quote
 from src.execution.interfaces import QuoteClient
 
+# Below this many slices the array setup cost outweighs the Python loop
+_NUMPY_MIN_SLICES = 16
+
+_NO_QUOTE = "No quote returned"
+
+
+def _quote_result(quote: Any) -> Tuple[bool, Union[Quote, str]]:
+    """
+    Convert a client response into an (ok, quote or error message) pair.
+    
+    Args:
+        quote: Quote, exception or None returned by a quote client
+        
+    Returns:
+        (True, quote) for a quote, (False, error message) otherwise
+    """
+    if quote is None:
+        return False, _NO_QUOTE
+    if isinstance(quote, BaseException):
+        return False, str(quote)
+    return True, quote
+
 
 class TWAPExecutor:
     """
@@ -23,7 +49,10 @@ class TWAPExecutor:
         quote_client: QuoteClient,
         num_slices: int = 5,
         slice_interval_sec: float = 2.0,
-        slippage_tolerance_pct: float = 1.0
+        slippage_tolerance_pct: float = 1.0,
+        prefetch_quotes: bool = False,
+        quote_ttl_ms: Optional[float] = None,
+        quote_cache_size: int = 256
     ):
         """
         Initialize TWAP executor.
@@ -33,11 +62,45 @@ class TWAPExecutor:
             num_slices: Number of slices to break order into
             slice_interval_sec: Time between slices
             slippage_tolerance_pct: Maximum acceptable slippage per slice
+            prefetch_quotes: Quote every slice up front in one batch request
+                (get_quotes_batch when the client has it) and only space
+                out the executions; otherwise each slice quotes at its
+                own scheduled time
+            quote_ttl_ms: How long a quote request may be shared by identical
+                (symbol, size, side) requests, measured from when it was
+                issued; defaults to half the slice interval, so concurrent
+                requests (prefetches, overlapping TWAPs) share one call
+                while every slice still gets a fresh quote. 0 disables
+            quote_cache_size: Maximum number of memoized quotes (LRU)
         """
         self.quote_client = quote_client
+        # Non-raising quote path, when the client offers one
+        self._try_get_quote = getattr(quote_client, "try_get_quote", None)
         self.num_slices = num_slices
         self.slice_interval_sec = slice_interval_sec
         self.slippage_tolerance_pct = slippage_tolerance_pct
+        self.prefetch_quotes = prefetch_quotes
+        self.quote_ttl_ms = (
+            slice_interval_sec * 500.0 if quote_ttl_ms is None else quote_ttl_ms
+        )
+        
+        # Memoized quotes: (symbol, size, side) -> (monotonic issue time, quote
+        # task); in-flight requests are shared too, so concurrent identical
+        # requests issue a single call
+        self._quote_memo: "OrderedDict[tuple, Tuple[float, asyncio.Future]]" = OrderedDict()
+        self._quote_cache_size = quote_cache_size
+    
+    @property
+    def slippage_tolerance_pct(self) -> float:
+        """Maximum acceptable slippage per slice, in percent."""
+        return self._slippage_tolerance_pct
+    
+    @slippage_tolerance_pct.setter
+    def slippage_tolerance_pct(self, value: float):
+        # Constant tail of the rejection reason, so rejected slices only
+        # format the quoted slippage
+        self._slippage_tolerance_pct = value
+        self._slippage_reject_suffix = f"% > {value}%"
     
     async def execute_twap(
         self,
@@ -55,70 +118,62 @@ class TWAPExecutor:
             Execution report with per-slice details
         """
         slice_size = action.size / self.num_slices
-        slice_reports: List[Dict[str, Any]] = []
-        total_filled = 0.0
-        total_cost = 0.0
-        rejected_slices = 0
+        symbol = market_state.symbol
+        side = action.action_type.value
         
-        for i in range(self.num_slices):
-            # Get quote for this slice
-            try:
-                quote = await self.quote_client.get_quote(
-                    symbol=market_state.symbol,
-                    size_notional=slice_size,
-                    side=action.action_type.value
-                )
-                
-                # Check slippage tolerance
-                slippage_pct = quote.get("slippage_pct", 0.0)
-                if slippage_pct > self.slippage_tolerance_pct:
-                    slice_reports.append({
-                        "slice": i + 1,
-                        "status": "rejected",
-                        "reason": f"Slippage {slippage_pct:.2f}% > {self.slippage_tolerance_pct}%",
-                        "size": slice_size,
-                        "slippage_pct": slippage_pct
-                    })
+        quotes: List[Optional[Tuple[bool, Union[Quote, str]]]]
+        if self.prefetch_quotes:
+            quotes = await self._fetch_quotes(symbol, [slice_size] * self.num_slices, side)
+        else:
+            quotes = [None] * self.num_slices
+        
+        # Slices keep their time spacing but run concurrently, so quote
+        # round-trips overlap instead of adding up
+        start = asyncio.get_running_loop().time()
+        results = await asyncio.gather(*(
+            self._run_slice(
+                i, start + i * self.slice_interval_sec, slice_size, symbol, side, quotes[i]
+            )
+            for i in range(self.num_slices)
+        ), return_exceptions=True)
+        # A slice that raised is reported like a failed quote, and
+        # return_exceptions keeps the other slices from being orphaned
+        slice_reports: List[Dict[str, Any]] = [
+            {"slice": i + 1, "status": "error", "reason": str(result), "size": slice_size}
+            if isinstance(result, BaseException) else result
+            for i, result in enumerate(results)
+        ]
+        
+        num_slices = self.num_slices
+        if num_slices >= _NUMPY_MIN_SLICES:
+            # One reduction per total instead of per-slice scalar adds
+            filled = np.fromiter(
+                (report["status"] == "filled" for report in slice_reports), bool, num_slices
+            )
+            costs = np.fromiter(
+                (report.get("cost", 0.0) for report in slice_reports), np.float64, num_slices
+            )
+            filled_count = int(filled.sum())
+            total_filled = float(np.where(filled, slice_size, 0.0).sum())
+            total_cost = float(costs.sum())
+            rejected_slices = num_slices - filled_count
+        else:
+            total_filled = 0.0
+            total_cost = 0.0
+            rejected_slices = 0
+            for report in slice_reports:
+                if report["status"] == "filled":
+                    total_filled += report["size"]
+                    total_cost += report["cost"]
+                else:
                     rejected_slices += 1
-                    continue
-                
-                # Execute slice
-                fill_price = quote.get("price", market_state.price)
-                fees = quote.get("fees", 0.0)
-                
-                slice_cost = slice_size * fill_price + fees
-                total_filled += slice_size
-                total_cost += slice_cost
-                
-                slice_reports.append({
-                    "slice": i + 1,
-                    "status": "filled",
-                    "size": slice_size,
-                    "fill_price": fill_price,
-                    "slippage_pct": slippage_pct,
-                    "fees": fees,
-                    "cost": slice_cost
-                })
-                
-            except Exception as e:
-                slice_reports.append({
-                    "slice": i + 1,
-                    "status": "error",
-                    "reason": str(e),
-                    "size": slice_size
-                })
-                rejected_slices += 1
-            
-            # Wait before next slice (except for last slice)
-            if i < self.num_slices - 1:
-                await asyncio.sleep(self.slice_interval_sec)
         
         # Calculate average fill price
         avg_fill_price = total_cost / total_filled if total_filled > 0 else market_state.price
         
         return {
             "success": rejected_slices < self.num_slices,
-            "action": action.action_type.value,
+            "action": side,
             "requested_size": action.size,
             "filled_size": total_filled,
             "fill_rate": total_filled / action.size if action.size > 0 else 0,
@@ -130,6 +185,198 @@ class TWAPExecutor:
             "slice_reports": slice_reports
         }
     
+    async def _fetch_quotes(
+        self,
+        symbol: str,
+        sizes: List[float],
+        side: str
+    ) -> List[Tuple[bool, Union[Quote, str]]]:
+        """
+        Quote several slice sizes at once.
+        
+        Uses the client's get_quotes_batch when available and falls back
+        to concurrent get_quote calls otherwise.
+        
+        Args:
+            symbol: Trading pair symbol
+            sizes: Slice sizes
+            side: Trade side ("buy" or "sell")
+            
+        Returns:
+            (ok, quote or error message) pairs in slice order
+        """
+        get_quotes_batch = getattr(self.quote_client, "get_quotes_batch", None)
+        if get_quotes_batch is not None:
+            # Uniform slices collapse to a single size in the request
+            unique_sizes = list(dict.fromkeys(sizes))
+            try:
+                quotes = await get_quotes_batch(symbol, unique_sizes, side)
+            except Exception as e:
+                return [(False, str(e))] * len(sizes)
+            by_size = {
+                size: _quote_result(quote) for size, quote in zip(unique_sizes, quotes)
+            }
+            return [by_size[size] for size in sizes]
+        return await asyncio.gather(*(
+            self._get_quote(symbol, size, side) for size in sizes
+        ))
+    
+    async def _request_quote(
+        self,
+        symbol: str,
+        size: float,
+        side: str
+    ) -> Tuple[bool, Union[Quote, str]]:
+        """
+        Ask the client for a quote, reporting failure as a value.
+        
+        Uses the client's try_get_quote when available, so failed quotes
+        cost no exception; otherwise wraps get_quote. Anything the client
+        still raises, and a missing quote, is reported as a failure.
+        
+        Args:
+            symbol: Trading pair symbol
+            size: Size in notional currency
+            side: Trade side ("buy" or "sell")
+            
+        Returns:
+            (True, quote) on success, (False, error message) on failure
+        """
+        try:
+            if self._try_get_quote is not None:
+                ok, result = await self._try_get_quote(symbol, size, side)
+            else:
+                ok, result = True, await self.quote_client.get_quote(
+                    symbol=symbol, size_notional=size, side=side
+                )
+        except Exception as e:
+            return False, str(e)
+        if ok and result is None:
+            return False, _NO_QUOTE
+        return ok, result
+    
+    async def _get_quote(
+        self,
+        symbol: str,
+        size: float,
+        side: str
+    ) -> Tuple[bool, Union[Quote, str]]:
+        """
+        Get a quote, reusing an identical request issued within the TTL.
+        
+        Args:
+            symbol: Trading pair symbol
+            size: Size in notional currency
+            side: Trade side ("buy" or "sell")
+            
+        Returns:
+            (ok, quote or error message) from the client or the memo
+        """
+        ttl_ms = self.quote_ttl_ms
+        if ttl_ms <= 0:
+            return await self._request_quote(symbol, size, side)
+        
+        memo = self._quote_memo
+        key = (symbol, round(size, 6), side)
+        now = time.monotonic()
+        entry = memo.get(key)
+        if entry is None or (now - entry[0]) * 1000.0 >= ttl_ms:
+            task = asyncio.ensure_future(self._request_quote(symbol, size, side))
+            # Registered before any waiter, so a failure is evicted before
+            # callers resume and the next request retries
+            task.add_done_callback(functools.partial(self._evict_failed_quote, key))
+            memo[key] = (now, task)
+            memo.move_to_end(key)
+            while len(memo) > self._quote_cache_size:
+                memo.popitem(last=False)
+        else:
+            task = entry[1]
+            memo.move_to_end(key)
+        
+        # Shield so one cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(task)
+    
+    def _evict_failed_quote(self, key: tuple, task: asyncio.Future):
+        """
+        Drop a memoized quote request that raised, was cancelled or failed.
+        
+        Args:
+            key: Memo key the task was stored under
+            task: Completed quote request
+        """
+        failed = task.cancelled() or task.exception() is not None or not task.result()[0]
+        entry = self._quote_memo.get(key)
+        if failed and entry is not None and entry[1] is task:
+            del self._quote_memo[key]
+    
+    async def _run_slice(
+        self,
+        index: int,
+        deadline: float,
+        slice_size: float,
+        symbol: str,
+        side: str,
+        quote: Optional[Tuple[bool, Union[Quote, str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Wait for a slice's scheduled start, then quote and fill it.
+        
+        Args:
+            index: Zero-based slice index
+            deadline: Event-loop time at which the slice should start
+            slice_size: Size of this slice
+            symbol: Trading pair symbol
+            side: Trade side ("buy" or "sell")
+            quote: Prefetched (ok, quote or error message) pair; fetched
+                at the scheduled time when None
+            
+        Returns:
+            Slice report with status "filled", "rejected" or "error"
+        """
+        # Sleep only the residual to an absolute deadline, so scheduling
+        # jitter does not accumulate into the slice spacing
+        delay = deadline - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        
+        if quote is None:
+            # Get quote for this slice
+            quote = await self._get_quote(symbol, slice_size, side)
+        
+        ok, quote = quote
+        if not ok:
+            return {
+                "slice": index + 1,
+                "status": "error",
+                "reason": quote,
+                "size": slice_size
+            }
+        
+        # Check slippage tolerance
+        slippage_pct = quote.slippage_pct
+        if slippage_pct > self._slippage_tolerance_pct:
+            return {
+                "slice": index + 1,
+                "status": "rejected",
+                "reason": "Slippage " + format(slippage_pct, ".2f") + self._slippage_reject_suffix,
+                "size": slice_size,
+                "slippage_pct": slippage_pct
+            }
+        
+        # Execute slice
+        fill_price = quote.price
+        fees = quote.fees_usd
+        
+        return {
+            "slice": index + 1,
+            "status": "filled",
+            "size": slice_size,
+            "fill_price": fill_price,
+            "slippage_pct": slippage_pct,
+            "fees": fees,
+            "cost": slice_size * fill_price + fees
+        }
+    
     async def execute_action(
         self,
         action: Action,
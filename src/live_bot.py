@@ -7,6 +7,7 @@ execute via appropriate executor.
 """
 import asyncio
 import json
+import orjson
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
@@ -22,6 +23,9 @@ from src.execution.twap_executor import TWAPExecutor
 from src.execution.interfaces import MarketDataFetcher
 from src.simulation.paper_trader import PaperTrader
 
+# Metrics may carry numpy scalars and non-string keys from the engines
+_METRICS_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
 
 class LiveBot:
     """
@@ -81,7 +85,7 @@ class LiveBot:
         else:
             self.paper_trader = None
             # In live mode, would initialize real executors
-            self.jito_executor = JitoWarpExecutor()
+            self.jito_executor = JitoWarpExecutor(simulate_wallclock=True)
             self.twap_executor = None  # Would need real quote client
         
         # Metrics
@@ -111,13 +115,13 @@ class LiveBot:
         
         # Step 2: LogicGate filter
         from src.core.types import Action
-        dummy_action = Action(
+        dummy_action = Action.fast_build(
             action_type=ActionType.BUY,
             size=1.0,
             confidence=0.5
         )
         
-        filter_result = self.logic_gate.check(market_state, dummy_action)
+        filter_result = self.logic_gate.check(market_state, dummy_action, collect_all=False)
         if not filter_result.allowed:
             self.blocked_count += 1
             return {
@@ -204,6 +208,11 @@ class LiveBot:
         self.running = True
         cycles_run = 0
         
+        # Open network connections before the first trading cycle
+        warmup = getattr(self.market_data_fetcher, "warmup", None)
+        if warmup is not None:
+            await warmup()
+        
         try:
             while self.running:
                 if max_cycles and cycles_run >= max_cycles:
@@ -222,6 +231,7 @@ class LiveBot:
         finally:
             self.running = False
             await self.persist_metrics()
+            await self.close()
     
     async def persist_metrics(self):
         """Persist performance metrics to JSON."""
@@ -242,12 +252,18 @@ class LiveBot:
             "trading_summary": summary
         }
         
-        with open(self.metrics_path, "w") as f:
-            json.dump(metrics, f, indent=2)
+        with open(self.metrics_path, "wb") as f:
+            f.write(orjson.dumps(metrics, option=_METRICS_JSON_OPTIONS))
     
     def stop(self):
         """Stop the bot loop."""
         self.running = False
+    
+    async def close(self):
+        """Release network resources held by the market data fetcher."""
+        aclose = getattr(self.market_data_fetcher, "aclose", None)
+        if aclose is not None:
+            await aclose()
 
 
 async def main():
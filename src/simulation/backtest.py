@@ -41,7 +41,7 @@ class Backtest:
             min_confidence: Minimum confidence for execution
         """
         self.logic_gate = logic_gate or LogicGate()
-        self.ensemble = ensemble or HyperEnsemble()
+        self.ensemble = ensemble or HyperEnsemble(record_votes=False)
         self.leverage_engine = leverage_engine or LeverageEngine()
         self.paper_trader = paper_trader or PaperTrader()
         self.min_confidence = min_confidence
@@ -104,14 +104,14 @@ class Backtest:
             
             # Create dummy action for logic gate
             from src.core.types import Action, ActionType
-            dummy_action = Action(
+            dummy_action = Action.fast_build(
                 action_type=ActionType.BUY,
                 size=1.0,
                 confidence=0.5
             )
             
             # Logic gate filter
-            filter_result = self.logic_gate.check(market_state, dummy_action)
+            filter_result = self.logic_gate.check(market_state, dummy_action, collect_all=False)
             
             if not filter_result.allowed:
                 results.append({
@@ -4,7 +4,7 @@ MarketSimulator: High-fidelity simulation using same components as live bot.
 Runs the full decision pipeline (LogicGate -> HyperEnsemble -> sizing -> execution)
 using paper trading instead of real execution.
 """
-import json
+import orjson
 import asyncio
 from typing import Optional, Dict, Any
 from pathlib import Path
@@ -15,6 +15,9 @@ from src.execution.leverage_engine import LeverageEngine, LeverageConfig
 from src.execution.interfaces import MarketDataFetcher
 from src.simulation.paper_trader import PaperTrader
 
+# Reports may carry numpy scalars and non-string keys from the engines
+_REPORT_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
 
 class MarketSimulator:
     """
@@ -66,7 +69,7 @@ class MarketSimulator:
             from src.core.onflow_engine import OnflowEngine
             from src.core.mdp_decision import MDPDecision
             
-            self.ensemble = HyperEnsemble()
+            self.ensemble = HyperEnsemble(record_votes=False)
             self.onflow_engine = OnflowEngine()
             self.mdp_engine = MDPDecision()
             
@@ -118,14 +121,14 @@ class MarketSimulator:
         
         # Create a dummy action for logic gate check
         from src.core.types import Action
-        dummy_action = Action(
+        dummy_action = Action.fast_build(
             action_type=ActionType.BUY,
             size=1.0,
             confidence=0.5
         )
         
         # Step 1: LogicGate filter
-        filter_result = self.logic_gate.check(market_state, dummy_action)
+        filter_result = self.logic_gate.check(market_state, dummy_action, collect_all=False)
         
         if not filter_result.allowed:
             self.decisions_blocked += 1
@@ -297,7 +300,7 @@ class MarketSimulator:
         }
         
         # Write to file
-        with open(self.metrics_path, "w") as f:
-            json.dump(report, f, indent=2)
+        with open(self.metrics_path, "wb") as f:
+            f.write(orjson.dumps(report, option=_REPORT_JSON_OPTIONS))
         
         return report
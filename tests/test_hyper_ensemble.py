@@ -0,0 +1,52 @@
+"""Unit tests for HyperEnsemble."""
+import gc
+import warnings
+import numpy as np
+import pytest
+from src.core.hyper_ensemble import HyperEnsemble
+from src.core.types import ActionType, MarketState
+
+
+def _market_state():
+    return MarketState(price=100.0, volume_24h=10000.0, bid=99.5, ask=100.5)
+
+
+@pytest.mark.asyncio
+async def test_run_async_trusted_failure_leaves_no_unawaited_engines():
+    """Test that a raising trusted engine doesn't strand already-built async engines."""
+    async def async_engine(market_state):
+        return ActionType.BUY, 0.8
+    
+    def broken_engine(market_state):
+        raise RuntimeError("engine bug")
+    
+    ensemble = HyperEnsemble()
+    ensemble.add_engine("async", async_engine)
+    ensemble.add_engine("broken", broken_engine, trusted=True)
+    
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        try:
+            await ensemble.run_async(_market_state())
+        except RuntimeError as e:
+            raised = str(e)
+        # Frames held by the traceback are gone now; collect any stranded coroutine
+        gc.collect()
+    
+    assert raised == "engine bug"
+    assert not [w for w in caught if "never awaited" in str(w.message)]
+
+
+def test_votes_coerce_engine_confidence_to_float():
+    """Test that numpy-scalar and int confidences are stored as plain floats."""
+    ensemble = HyperEnsemble()
+    ensemble.add_engine("numpy", lambda market_state: (ActionType.BUY, np.float32(0.75)))
+    ensemble.add_engine("int", lambda market_state: (ActionType.BUY, 1), trusted=True)
+    
+    decision = ensemble.run_sync(_market_state())
+    
+    assert set(decision.engine_votes) == {"numpy", "int"}
+    for vote in decision.engine_votes.values():
+        assert type(vote["confidence"]) is float
+    assert type(decision.consensus_confidence) is float
+    assert type(decision.action.confidence) is float
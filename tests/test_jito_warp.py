@@ -0,0 +1,84 @@
+"""Unit tests for JitoWarpExecutor."""
+import numpy as np
+import pytest
+from src.core.types import Action, ActionType, MarketState
+from src.execution.jito_warp import JitoWarpExecutor
+
+
+@pytest.mark.asyncio
+async def test_execute_many_matches_execute_bundle():
+    """Test that batched bundles price, charge fees and report latency like execute_bundle."""
+    is_buy = np.array([True, False, True, False])
+    sizes = np.array([500.0, 500.0, 2500.0, 40.0])
+    prices = np.array([100.0, 100.0, 150.0, 80.0])
+    liquidity_scores = np.array([1.0, 1.0, 0.4, 0.9])
+
+    def executor():
+        return JitoWarpExecutor(
+            latency_variance_ms=0.0, inclusion_probability=1.0, seed=7
+        )
+
+    batch = executor().execute_many(is_buy, sizes, prices, liquidity_scores)
+
+    single = executor()
+    for i in range(len(sizes)):
+        action = Action(
+            action_type=ActionType.BUY if is_buy[i] else ActionType.SELL,
+            size=float(sizes[i]),
+            confidence=0.8
+        )
+        market_state = MarketState(
+            price=float(prices[i]),
+            volume_24h=10000.0,
+            bid=float(prices[i]) * 0.999,
+            ask=float(prices[i]) * 1.001,
+            liquidity_score=float(liquidity_scores[i])
+        )
+        report = await single.execute_bundle(action, market_state)
+
+        assert report["success"] and batch["success"][i]
+        assert batch["fill_price"][i] == pytest.approx(report["fill_price"])
+        assert batch["slippage_pct"][i] == pytest.approx(report["slippage_pct"])
+        assert batch["latency_ms"][i] == pytest.approx(report["latency_ms"])
+        assert batch["jito_tip_usd"][i] == pytest.approx(report["jito_tip_usd"])
+        assert batch["network_fee_usd"][i] == pytest.approx(report["network_fee_usd"])
+        assert batch["total_fees_usd"][i] == pytest.approx(report["total_fees_usd"])
+
+    # Buys fill above the market price, sells below
+    assert (batch["fill_price"][is_buy] > prices[is_buy]).all()
+    assert (batch["fill_price"][~is_buy] < prices[~is_buy]).all()
+
+
+def test_execute_many_inclusion_and_latency():
+    """Test seeded reproducibility, the inclusion rate and the latency floor."""
+    n = 20000
+    args = (
+        np.ones(n, dtype=bool), np.full(n, 100.0), np.full(n, 100.0), np.ones(n)
+    )
+
+    first = JitoWarpExecutor(base_latency_ms=60.0, inclusion_probability=0.7, seed=11)
+    second = JitoWarpExecutor(base_latency_ms=60.0, inclusion_probability=0.7, seed=11)
+    result = first.execute_many(*args)
+    repeat = second.execute_many(*args)
+
+    for key, values in result.items():
+        np.testing.assert_array_equal(values, repeat[key])
+    assert result["success"].mean() == pytest.approx(0.7, abs=0.02)
+    assert result["latency_ms"].min() >= 50.0
+
+    never = JitoWarpExecutor(inclusion_probability=0.0, seed=11).execute_many(*args)
+    assert not never["success"].any()
+
+
+@pytest.mark.asyncio
+async def test_execute_bundle_uses_current_inclusion_probability():
+    """Test that changing inclusion_probability applies to the next bundle."""
+    executor = JitoWarpExecutor(inclusion_probability=1.0, seed=3)
+    action = Action(action_type=ActionType.BUY, size=100.0, confidence=0.8)
+    market_state = MarketState(price=100.0, volume_24h=10000.0, bid=99.9, ask=100.1)
+
+    assert (await executor.execute_bundle(action, market_state))["success"]
+
+    executor.inclusion_probability = 0.0
+    reports = [await executor.execute_bundle(action, market_state) for _ in range(20)]
+    assert not any(report["success"] for report in reports)
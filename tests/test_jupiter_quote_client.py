@@ -0,0 +1,127 @@
+"""Unit tests for JupiterQuoteClient batching and quote caching."""
+import asyncio
+import aiohttp
+import orjson
+import pytest
+from src.adapters.jupiter_quote_client import JupiterQuoteClient
+
+
+class StubResponse:
+    """Minimal aiohttp response: raise_for_status() and read()."""
+
+    def __init__(self, body: bytes, delay: float):
+        self.body = body
+        self.delay = delay
+
+    async def __aenter__(self):
+        await asyncio.sleep(self.delay)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self) -> bytes:
+        return self.body
+
+
+class StubSession:
+    """
+    Session that prices buys at $100 + $1 per $100 of size.
+
+    Amounts listed in `malformed` get an unparseable body and amounts in
+    `unreachable` raise a connection error. Larger sizes answer sooner, so
+    responses complete out of request order.
+    """
+
+    closed = False
+
+    def __init__(self, malformed=(), unreachable=()):
+        self.malformed = set(malformed)
+        self.unreachable = set(unreachable)
+        self.calls = 0
+
+    def get(self, url, params=None, timeout=None):
+        self.calls += 1
+        amount = int(params["amount"])
+        if amount in self.unreachable:
+            raise aiohttp.ClientConnectionError("connection refused")
+        if amount in self.malformed:
+            return StubResponse(b"<html>rate limited</html>", 0.0)
+        size_usd = amount / 1e6
+        price = 100.0 + size_usd / 100.0
+        body = orjson.dumps({
+            "inAmount": str(amount),
+            "outAmount": str(int(amount / price * 1e3)),
+            "priceImpactPct": "0.01",
+            "routePlan": [{"swapInfo": {"label": "Orca"}}]
+        })
+        return StubResponse(body, 3.0 / size_usd)
+
+
+def _client(session, **kwargs):
+    client = JupiterQuoteClient(**kwargs)
+    client._session = session
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_quotes_batch_keeps_request_order():
+    """Test that batched quotes come back in size order despite completion order."""
+    session = StubSession()
+    client = _client(session)
+
+    quotes = await client.get_quotes_batch("SOL/USD", [100.0, 200.0, 300.0], "buy")
+
+    assert [q.price for q in quotes] == pytest.approx([101.0, 102.0, 103.0], rel=1e-6)
+    assert all(q.route_plan == ("Orca",) for q in quotes)
+    assert session.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_get_quotes_returns_exceptions_per_request():
+    """Test that one malformed response fails only its own request."""
+    session = StubSession(malformed={200 * 10**6})
+    client = _client(session)
+
+    quotes = await client.get_quotes([
+        ("SOL/USD", 100.0, "buy"),
+        ("SOL/USD", 200.0, "buy"),
+        ("SOL/USD", 300.0, "buy"),
+    ])
+
+    assert isinstance(quotes[1], ValueError)
+    assert quotes[0].price == pytest.approx(101.0, rel=1e-6)
+    assert quotes[2].price == pytest.approx(103.0, rel=1e-6)
+
+
+@pytest.mark.asyncio
+async def test_quote_cache_hit_and_expiry():
+    """Test that repeated quotes are served from cache until the TTL passes."""
+    session = StubSession()
+    client = _client(session, quote_ttl_sec=0.05)
+
+    first = await client.get_quote("SOL/USD", 100.0, "buy")
+    second = await client.get_quote("SOL/USD", 100.0, "buy")
+    assert second is first
+    assert session.calls == 1
+
+    await asyncio.sleep(0.06)
+    third = await client.get_quote("SOL/USD", 100.0, "buy")
+    assert third is not first
+    assert session.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_fallback_quotes_are_not_cached():
+    """Test that a fallback quote from a failed request is not reused."""
+    session = StubSession(unreachable={100 * 10**6})
+    client = _client(session, max_retries=1)
+
+    first = await client.get_quote("SOL/USD", 100.0, "buy")
+    second = await client.get_quote("SOL/USD", 100.0, "buy")
+
+    assert first.is_fallback and second.is_fallback
+    assert session.calls == 2
@@ -0,0 +1,61 @@
+"""Unit tests for LeverageEngine position sizing."""
+import numpy as np
+import pytest
+from src.core.types import Action, ActionType, MarketState
+from src.execution import _sizing_kernels
+from src.execution.leverage_engine import LeverageConfig, LeverageEngine
+
+
+def _candidates():
+    """Grid of candidates spanning both sides of the high-volatility cut."""
+    conf, vol, liq = np.meshgrid(
+        [0.0, 0.2, 0.55, 0.9, 1.0],
+        [0.0, 0.02, 0.05, 0.051, 0.2],
+        [0.1, 0.6, 1.0],
+        indexing="ij"
+    )
+    return conf.ravel(), vol.ravel(), liq.ravel()
+
+
+def test_size_positions_batch_matches_size_position():
+    """Test that batch sizing matches per-action size_position, including high volatility."""
+    engine = LeverageEngine(LeverageConfig(max_leverage=4.0, account_balance=250.0))
+    confidences, volatilities, liquidity_scores = _candidates()
+
+    sizes, leverages, allocations = engine.size_positions_batch(
+        confidences, volatilities, liquidity_scores
+    )
+
+    for i in range(confidences.shape[0]):
+        market_state = MarketState(
+            price=100.0,
+            volume_24h=10000.0,
+            bid=99.5,
+            ask=100.5,
+            volatility=float(volatilities[i]),
+            liquidity_score=float(liquidity_scores[i])
+        )
+        action = Action(
+            action_type=ActionType.BUY, size=0.0, confidence=float(confidences[i])
+        )
+        sized = engine.size_position(action, market_state)
+
+        assert sizes[i] == pytest.approx(sized.size)
+        assert leverages[i] == pytest.approx(sized.leverage)
+        assert allocations[i] == pytest.approx(sized.metadata["allocation_pct"])
+
+    # Both sides of the volatility cut are exercised
+    assert (volatilities > _sizing_kernels._HIGH_VOLATILITY).any()
+    assert (volatilities <= _sizing_kernels._HIGH_VOLATILITY).any()
+
+
+def test_size_positions_loop_matches_numpy_fallback():
+    """Test that the per-candidate loop kernel and the NumPy fallback agree."""
+    confidences, volatilities, liquidity_scores = _candidates()
+    args = (confidences, volatilities, liquidity_scores, 250.0, 0.35, 0.01, 4.0)
+
+    loop_results = _sizing_kernels._size_positions_loop(*args)
+    numpy_results = _sizing_kernels._size_positions_numpy(*args)
+
+    for loop_values, numpy_values in zip(loop_results, numpy_results):
+        np.testing.assert_allclose(loop_values, numpy_values)
@@ -103,3 +103,66 @@ def test_logic_gate_blocks_low_volume():
     
     assert not result.allowed
     assert any("Volume" in reason for reason in result.reasons)
+
+
+def test_logic_gate_fast_fail_stops_at_first_rule():
+    """Test that collect_all=False reports only the first failing rule."""
+    gate = LogicGate(max_mev_risk=0.5, max_latency_ms=200.0)
+    
+    market_state = MarketState(
+        price=100.0,
+        volume_24h=10000.0,
+        bid=99.5,
+        ask=100.5,
+        mev_risk_score=0.8,  # High MEV risk
+        latency_ms=600.0  # High latency
+    )
+    
+    action = Action(
+        action_type=ActionType.BUY,
+        size=10.0,
+        confidence=0.9
+    )
+    
+    full = gate.check(market_state, action)
+    fast = gate.check(market_state, action, collect_all=False)
+    
+    assert not fast.allowed
+    assert len(full.reasons) == 2
+    assert fast.reasons == full.reasons[:1]
+    assert "MEV risk" in fast.reasons[0]
+
+
+def test_logic_gate_uses_reassigned_thresholds():
+    """Test that reassigning a percent threshold changes what the gate blocks."""
+    gate = LogicGate(max_price_jump_pct=5.0, max_ema_deviation_pct=10.0)
+    
+    # 1% spread and ~3% deviation from the EMA average
+    market_state = MarketState(
+        price=103.0,
+        volume_24h=10000.0,
+        bid=99.5,
+        ask=100.5,
+        ema_fast=100.0,
+        ema_slow=100.0
+    )
+    
+    action = Action(
+        action_type=ActionType.BUY,
+        size=10.0,
+        confidence=0.9
+    )
+    
+    assert gate.check(market_state, action).allowed
+    
+    gate.max_price_jump_pct = 0.5
+    gate.max_ema_deviation_pct = 2.0
+    result = gate.check(market_state, action)
+    
+    assert not result.allowed
+    assert any("spread too wide" in r and "> 0.5%" in r for r in result.reasons)
+    assert any("deviation from EMA" in r and "> 2.0%" in r for r in result.reasons)
+    
+    gate.max_price_jump_pct = 5.0
+    gate.max_ema_deviation_pct = 10.0
+    assert gate.check(market_state, action).allowed
@@ -1,7 +1,8 @@
 """Unit tests for MDPDecision."""
+import numpy as np
 import pytest
 from src.core.mdp_decision import MDPDecision
-from src.core.types import MarketState, ActionType, MarketRegime
+from src.core.types import MarketState, ActionType, MarketRegime, ACTION_INDEX
 
 
 def test_mdp_decision_select_action_returns_valid_action():
@@ -149,3 +150,143 @@ def test_mdp_decision_state_discretization():
     assert idx1 != idx2
     assert isinstance(idx1, int)
     assert isinstance(idx2, int)
+
+
+def test_mdp_decision_q_update_value():
+    """Test that a single Q-learning update moves Q(s,a) toward the target."""
+    mdp = MDPDecision(learning_rate=0.5, discount_factor=0.9)
+    
+    state = MarketState(
+        price=100.0,
+        volume_24h=10000.0,
+        bid=99.5,
+        ask=100.5,
+        regime=MarketRegime.TRENDING_UP,
+        volatility=0.02,
+        liquidity_score=0.8
+    )
+    
+    mdp.update(state=state, action=ActionType.BUY, reward=1.0, next_state=state, done=False)
+    
+    state_idx = mdp._discretize_state(state)
+    # Q = 0 + 0.5 * (1.0 + 0.9 * 0.0 - 0) = 0.5
+    assert mdp.q_table[state_idx][ACTION_INDEX[ActionType.BUY]] == pytest.approx(0.5)
+    
+    action_type, confidence = mdp.select_action(state, explore=False)
+    assert action_type == ActionType.BUY
+    assert confidence > 0.5
+
+
+def test_mdp_decision_replay_updates_q_table():
+    """Test that replaying remembered transitions applies Q-learning updates."""
+    mdp = MDPDecision(learning_rate=0.5, replay_capacity=4)
+    
+    state = MarketState(
+        price=100.0,
+        volume_24h=10000.0,
+        bid=99.5,
+        ask=100.5,
+        regime=MarketRegime.TRENDING_UP,
+        volatility=0.02,
+        liquidity_score=0.8
+    )
+    
+    assert mdp.replay(batch_size=8) == 0
+    
+    # More transitions than capacity: buffer wraps around
+    for _ in range(6):
+        mdp.remember(state, ActionType.SELL, reward=1.0, next_state=state, done=True)
+    
+    assert mdp.replay(batch_size=8) == 8
+    
+    state_idx = mdp._discretize_state(state)
+    sell_q = mdp.q_table[state_idx][ACTION_INDEX[ActionType.SELL]]
+    # Duplicate samples of one (s, a) pair take a single averaged step
+    assert sell_q == pytest.approx(0.5)
+    
+    action_type, _ = mdp.select_action(state, explore=False)
+    assert action_type == ActionType.SELL
+
+
+def test_mdp_decision_save_load_roundtrip(tmp_path):
+    """Test that a saved Q-table restores values and greedy actions."""
+    mdp = MDPDecision(learning_rate=0.5)
+    
+    state = MarketState(
+        price=100.0,
+        volume_24h=10000.0,
+        bid=99.5,
+        ask=100.5,
+        regime=MarketRegime.RANGING,
+        volatility=0.03,
+        liquidity_score=0.5
+    )
+    
+    mdp.update(state=state, action=ActionType.HOLD, reward=1.0, next_state=state, done=True)
+    path = tmp_path / "qtable.npz"
+    mdp.save(str(path))
+    
+    restored = MDPDecision()
+    restored.load(str(path))
+    
+    assert restored.epsilon == pytest.approx(mdp.epsilon)
+    assert restored.episode_count == mdp.episode_count
+    assert (restored.q_table == mdp.q_table).all()
+    assert restored.get_state()["q_table_size"] == 1
+    
+    action_type, _ = restored.select_action(state, explore=False)
+    assert action_type == ActionType.HOLD
+
+
+def test_mdp_decision_q_table_size_counts_visited_states():
+    """Test that get_state reports visited states, not the dense table size."""
+    mdp = MDPDecision()
+    
+    state = MarketState(
+        price=100.0,
+        volume_24h=10000.0,
+        bid=99.5,
+        ask=100.5,
+        regime=MarketRegime.TRENDING_UP,
+        volatility=0.01,
+        liquidity_score=0.8
+    )
+    
+    next_state = MarketState(
+        price=95.0,
+        volume_24h=10000.0,
+        bid=94.5,
+        ask=95.5,
+        regime=MarketRegime.TRENDING_DOWN,
+        volatility=0.06,
+        liquidity_score=0.3
+    )
+    
+    assert mdp.get_state()["q_table_size"] == 0
+    
+    mdp.select_action(state, explore=False)
+    assert mdp.get_state()["q_table_size"] == 1
+    
+    mdp.update(state=state, action=ActionType.BUY, reward=1.0, next_state=next_state)
+    mdp.update(state=state, action=ActionType.SELL, reward=-1.0, next_state=next_state)
+    assert mdp.get_state()["q_table_size"] == 2
+
+
+def test_mdp_decision_load_rejects_mismatched_visited_mask(tmp_path):
+    """Test that load() rejects a visited mask of the wrong length."""
+    mdp = MDPDecision()
+    path = tmp_path / "qtable.npz"
+    np.savez_compressed(
+        path,
+        q=mdp.q_table,
+        visited=np.ones(mdp.n_states + 1, dtype=bool),
+        epsilon=0.5,
+        episode_count=3
+    )
+    
+    with pytest.raises(ValueError, match="Visited mask shape"):
+        mdp.load(str(path))
+    
+    # Nothing was partially restored
+    assert mdp.get_state()["q_table_size"] == 0
+    assert mdp.episode_count == 0
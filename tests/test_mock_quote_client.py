@@ -0,0 +1,52 @@
+"""Unit tests for the mock market data fetcher."""
+import numpy as np
+import pytest
+from src.adapters.mock_quote_client import MockMarketDataFetcher
+
+# Hits the upper band, walks back from it, then hits the lower band
+CHANGES = [0.3, 0.3, -0.2, 0.1, -0.45, -0.4, 0.5, 0.05]
+
+
+class FixedNormalRng:
+    """Generator wrapper whose normal() returns preset price changes."""
+
+    def __init__(self, changes):
+        self._changes = np.asarray(changes)
+        self._rng = np.random.default_rng(0)
+
+    def normal(self, loc, scale, size):
+        return self._changes[:size]
+
+    def __getattr__(self, name):
+        return getattr(self._rng, name)
+
+
+@pytest.mark.asyncio
+async def test_batch_walk_clips_each_step_like_fetch_market_state():
+    """Test that the batch walk matches the scalar walk at the band edges."""
+    scalar = MockMarketDataFetcher(base_price=100.0)
+    feed = iter(CHANGES)
+    scalar._samples.gauss = lambda mu, sigma: next(feed)
+    scalar_prices = [
+        (await scalar.fetch_market_state("SOL/USD")).price for _ in CHANGES
+    ]
+
+    batch = MockMarketDataFetcher(base_price=100.0)
+    batch._samples.rng = FixedNormalRng(CHANGES)
+    batch_prices = [s.price for s in batch.fetch_market_states_batch("SOL/USD", len(CHANGES))]
+
+    assert batch_prices == pytest.approx(scalar_prices)
+    assert max(batch_prices) == pytest.approx(150.0)
+    assert min(batch_prices) == pytest.approx(50.0)
+    assert batch.current_price == pytest.approx(scalar.current_price)
+
+
+def test_batch_walk_inside_band_is_compounded():
+    """Test that a walk that never touches the band is the plain cumulative product."""
+    changes = [0.01, -0.02, 0.015, 0.0]
+    fetcher = MockMarketDataFetcher(base_price=100.0)
+    fetcher._samples.rng = FixedNormalRng(changes)
+
+    prices = [s.price for s in fetcher.fetch_market_states_batch("SOL/USD", len(changes))]
+
+    assert prices == pytest.approx((100.0 * np.cumprod(1 + np.asarray(changes))).tolist())
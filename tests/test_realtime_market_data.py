@@ -0,0 +1,38 @@
+"""Unit tests for RealTimeMarketDataFetcher EMA/regime tracking."""
+import math
+import numpy as np
+import pytest
+from src.adapters import _ema_kernels
+from src.adapters.realtime_market_data import RealTimeMarketDataFetcher
+from src.core.types import MarketRegime
+
+
+def test_replay_prices_matches_per_fetch_updates():
+    """Test that bulk replay gives the same EMAs and regimes as fetching each price."""
+    prices = np.concatenate([np.linspace(100.0, 130.0, 40), np.linspace(130.0, 90.0, 60)])
+
+    replayed = RealTimeMarketDataFetcher()
+    ema_fast, ema_slow, regimes = replayed.replay_prices("SOL/USD", prices)
+
+    stepped = RealTimeMarketDataFetcher()
+    states = [
+        stepped._build_market_state("SOL/USD", float(price), {}, 0.0) for price in prices
+    ]
+
+    assert ema_fast == pytest.approx([s.ema_fast for s in states])
+    assert ema_slow == pytest.approx([s.ema_slow for s in states])
+    assert regimes == [s.regime for s in states]
+    assert {MarketRegime.TRENDING_UP, MarketRegime.TRENDING_DOWN} <= set(regimes)
+    assert replayed._ema_state["SOL/USD"] == pytest.approx(stepped._ema_state["SOL/USD"])
+
+
+def test_ema_replay_loop_matches_python_fallback():
+    """Test that the Numba replay loop, run as plain Python, matches the fallback."""
+    prices = np.concatenate([np.linspace(100.0, 130.0, 40), np.linspace(130.0, 90.0, 60)])
+    args = (prices, math.nan, math.nan, 0.2, 0.067)
+    
+    loop_results = _ema_kernels._update_ema_regime_loop(*args)
+    py_results = _ema_kernels._update_ema_regime_py(*args)
+    
+    for loop_values, py_values in zip(loop_results, py_results):
+        np.testing.assert_allclose(loop_values, py_values)
@@ -0,0 +1,213 @@
+"""Unit tests for TWAPExecutor."""
+import asyncio
+import types
+import pytest
+from src.adapters.jupiter_quote_client import JupiterQuoteClient
+from src.core.types import Action, ActionType, MarketState, Quote
+from src.execution import twap_executor
+from src.execution.twap_executor import TWAPExecutor
+
+
+def _market_state():
+    return MarketState(price=100.0, volume_24h=10000.0, bid=99.9, ask=100.1)
+
+
+def _buy(size=1000.0):
+    return Action(action_type=ActionType.BUY, size=size, confidence=0.9)
+
+
+class FlakyQuoteClient:
+    """Quote client that raises for the first `failures` calls."""
+
+    def __init__(self, failures=0, exc=RuntimeError("dead pool")):
+        self.failures = failures
+        self.exc = exc
+        self.calls = 0
+
+    async def get_quote(self, symbol, size_notional, side):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.exc
+        return Quote(price=100.0, slippage_pct=0.1, fees_usd=0.5, estimated_fill=1.0)
+
+
+class RaisingTryQuoteClient(FlakyQuoteClient):
+    """Quote client whose non-raising path raises anyway."""
+
+    async def try_get_quote(self, symbol, size_notional, side):
+        raise AttributeError("'NoneType' object has no attribute 'get'")
+
+
+class NoneQuoteClient(FlakyQuoteClient):
+    """Quote client that returns no quote."""
+
+    async def get_quote(self, symbol, size_notional, side):
+        return None
+
+
+class ScriptedQuoteClient:
+    """Quote client that cycles through fill / reject / raise / malformed."""
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.call_times = []
+
+    async def get_quote(self, symbol, size_notional, side):
+        call = len(self.call_times)
+        self.call_times.append(asyncio.get_running_loop().time())
+        await asyncio.sleep(self.delays.get(call, 0.0))
+        kind = call % 4
+        if kind == 0:
+            return Quote(price=100.0 + call, slippage_pct=0.1, fees_usd=0.5, estimated_fill=1.0)
+        if kind == 1:
+            return Quote(price=100.0, slippage_pct=5.0, fees_usd=0.5, estimated_fill=1.0)
+        if kind == 2:
+            raise RuntimeError("rate limited")
+        # Not a Quote, so the slice itself raises
+        return object()
+
+
+@pytest.mark.asyncio
+async def test_twap_slices_follow_schedule():
+    """Test that slice quotes start on the fixed interval from the first slice."""
+    client = ScriptedQuoteClient()
+    executor = TWAPExecutor(client, num_slices=4, slice_interval_sec=0.05, quote_ttl_ms=0)
+
+    await executor.execute_twap(_buy(), _market_state())
+
+    offsets = [t - client.call_times[0] for t in client.call_times]
+    for i, offset in enumerate(offsets):
+        assert i * 0.05 - 0.005 <= offset < i * 0.05 + 0.04
+
+
+@pytest.mark.asyncio
+async def test_twap_reports_stay_in_slice_order():
+    """Test that slice reports are ordered by slice even when quotes finish out of order."""
+    # Earlier slices answer later, so completion order is reversed
+    client = ScriptedQuoteClient(delays={0: 0.06, 1: 0.03})
+    executor = TWAPExecutor(client, num_slices=3, slice_interval_sec=0.01, quote_ttl_ms=0)
+
+    report = await executor.execute_twap(_buy(), _market_state())
+
+    reports = report["slice_reports"]
+    assert [r["slice"] for r in reports] == [1, 2, 3]
+    assert [r["status"] for r in reports] == ["filled", "rejected", "error"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("num_slices", [8, 18])
+async def test_twap_totals(num_slices):
+    """Test filled / rejected / error totals on the loop and NumPy paths."""
+    executor = TWAPExecutor(
+        ScriptedQuoteClient(), num_slices=num_slices, slice_interval_sec=0.005, quote_ttl_ms=0
+    )
+
+    report = await executor.execute_twap(_buy(1800.0), _market_state())
+
+    reports = report["slice_reports"]
+    slice_size = 1800.0 / num_slices
+    filled = [r for r in reports if r["status"] == "filled"]
+    expected_statuses = ["filled", "rejected", "error", "error"] * (num_slices // 4 + 1)
+    assert [r["status"] for r in reports] == expected_statuses[:num_slices]
+    assert report["filled_slices"] == len(filled)
+    assert report["rejected_slices"] == num_slices - len(filled)
+    assert report["filled_size"] == pytest.approx(slice_size * len(filled))
+    assert report["total_cost"] == pytest.approx(sum(r["cost"] for r in filled))
+    assert report["avg_fill_price"] == pytest.approx(
+        report["total_cost"] / report["filled_size"]
+    )
+    assert report["success"] is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("client_cls", [RaisingTryQuoteClient, NoneQuoteClient])
+@pytest.mark.parametrize("quote_ttl_ms", [None, 0])
+async def test_twap_quote_failures_become_error_slices(client_cls, quote_ttl_ms):
+    """Test that unexpected quote errors and missing quotes don't abort the TWAP."""
+    executor = TWAPExecutor(
+        client_cls(), num_slices=3, slice_interval_sec=0.001, quote_ttl_ms=quote_ttl_ms
+    )
+
+    report = await executor.execute_twap(_buy(), _market_state())
+
+    assert report["success"] is False
+    assert report["rejected_slices"] == 3
+    assert [r["status"] for r in report["slice_reports"]] == ["error"] * 3
+
+
+@pytest.mark.asyncio
+async def test_twap_failed_memoized_quote_is_retried():
+    """Test that a failed quote is evicted from the memo instead of replayed."""
+    client = FlakyQuoteClient(failures=1)
+    executor = TWAPExecutor(client, num_slices=2, quote_ttl_ms=60_000.0)
+
+    first_ok, first = await executor._get_quote("SOL/USD", 100.0, "buy")
+    second_ok, second = await executor._get_quote("SOL/USD", 100.0, "buy")
+    third_ok, third = await executor._get_quote("SOL/USD", 100.0, "buy")
+
+    assert (first_ok, first) == (False, "dead pool")
+    assert second_ok and third is second
+    assert client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_twap_default_ttl_shares_concurrent_quotes():
+    """Test that with default settings concurrent identical requests share one call."""
+    client = FlakyQuoteClient()
+    executor = TWAPExecutor(client, num_slices=3, slice_interval_sec=0.02)
+
+    # Two overlapping TWAPs for the same order: each slice is quoted once
+    first, second = await asyncio.gather(
+        executor.execute_twap(_buy(), _market_state()),
+        executor.execute_twap(_buy(), _market_state())
+    )
+    assert first["filled_slices"] == second["filled_slices"] == 3
+    assert client.calls == 3
+
+    # Prefetching quotes every slice at once: one call for the whole run
+    client = FlakyQuoteClient()
+    executor = TWAPExecutor(client, num_slices=3, slice_interval_sec=0.02, prefetch_quotes=True)
+    report = await executor.execute_twap(_buy(), _market_state())
+    assert report["filled_slices"] == 3
+    assert client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_twap_memo_ttl_is_measured_from_issue_time(monkeypatch):
+    """Test that the default TTL shares quotes by age, not by wall-clock bucket."""
+    clock = iter([0.0199, 0.0201, 0.0300])
+    monkeypatch.setattr(twap_executor, "time", types.SimpleNamespace(monotonic=lambda: next(clock)))
+    client = FlakyQuoteClient()
+    # Default TTL is half the 20 ms slice interval
+    executor = TWAPExecutor(client, num_slices=3, slice_interval_sec=0.02)
+
+    _, first = await executor._get_quote("SOL/USD", 100.0, "buy")
+    # 0.2 ms later, across a 20 ms boundary: still shared
+    _, second = await executor._get_quote("SOL/USD", 100.0, "buy")
+    # 10.1 ms after the first request: expired
+    _, third = await executor._get_quote("SOL/USD", 100.0, "buy")
+
+    assert second is first
+    assert third is not first
+    assert client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_twap_default_ttl_refreshes_each_slice():
+    """Test that with default settings every slice of a run gets a fresh quote."""
+    client = FlakyQuoteClient()
+    executor = TWAPExecutor(client, num_slices=3, slice_interval_sec=0.02)
+
+    await executor.execute_twap(_buy(), _market_state())
+
+    assert client.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_jupiter_try_get_quote_reports_missing_quote():
+    """Test that JupiterQuoteClient.try_get_quote never returns (True, None)."""
+    async with JupiterQuoteClient(max_retries=0) as client:
+        ok, result = await client.try_get_quote("SOL/USD", 100.0, "buy")
+
+    assert ok is False
+    assert isinstance(result, str)
@@ -123,6 +123,7 @@ async def run_simulation(
             jupiter_endpoint=os.getenv("JUPITER_ENDPOINT", "https://quote-api.jup.ag/v6"),
             birdeye_api_key=os.getenv("BIRDEYE_API_KEY")
         )
+        await fetcher.warmup()
     else:
         logger.info("Using MOCK market data (synthetic random walk)")
         if gui:
@@ -258,6 +259,11 @@ async def run_simulation(
             gui.update("log", {"message": f"\n[ERROR] {e}\n"})
             gui.close()
         raise
+    finally:
+        # Release pooled HTTP connections held by real-time fetchers
+        aclose = getattr(fetcher, "aclose", None)
+        if aclose is not None:
+            await aclose()
 
 
 # ============================================================================